@@ -12,12 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import sphinx_rtd_theme
 import os
+import shutil
 import sys
 
-sys.path.insert(0, os.path.abspath('../../'))
-
 
 # -- Project information -----------------------------------------------------
 project = 'NNablaNAS'
@@ -32,30 +30,75 @@ release = '0.9'
 # extensions coming with Sphinx (named 'sphinx.ext.*') or your custom
 # ones.
 extensions = [
-    'sphinx.ext.doctest',
-    'sphinx.ext.autodoc',
+    # viewcode has to be loaded before AutoAPI, which only hooks into it
+    # when its events are already registered.
+    'sphinx.ext.viewcode',
+    'autoapi.extension',
     'sphinx.ext.napoleon',
     'sphinx.ext.intersphinx',
-    'sphinx.ext.todo',
-    'sphinx.ext.mathjax',
-    'sphinx.ext.autosummary',
-    'sphinx.ext.viewcode',
     'sphinxcontrib.bibtex'
 ]
 
+# The doctest directives are only needed by the doctest builder, run it with
+# "make doctest" (or ``sphinx-build -t rundoctest -b doctest``).
+if tags.has('rundoctest'):  # noqa: F821
+    extensions.append('sphinx.ext.doctest')
+
+# Equations are rendered once to SVG images, which are kept between
+# incremental builds, when a LaTeX toolchain is installed. Otherwise fall
+# back to rendering them with MathJax in the browser.
+if shutil.which('latex') and shutil.which('dvisvgm'):
+    extensions.append('sphinx.ext.imgmath')
+    imgmath_image_format = 'svg'
+    imgmath_use_preview = True
+else:
+    extensions.append('sphinx.ext.mathjax')
+
 bibtex_bibfiles = ['bibtex/reference.bib']
 
+# AutoAPI parses the package sources statically instead of importing them,
+# so nnabla and the other runtime dependencies are never loaded by the build.
+# The API page is written by hand (nnablanas_api.rst) with the
+# ``autoapimodule`` directives, hence no pages are generated.
+autoapi_dirs = ['../../nnabla_nas']
+autoapi_options = ['members', 'undoc-members', 'show-inheritance']
+autoapi_generate_api_docs = False
+autoapi_add_toctree_entry = False
+
+# The package docstrings are written in Google style only.
+napoleon_google_docstring = True
+napoleon_numpy_docstring = False
+
+# sphinx.ext.autosummary only comes in as a dependency of AutoAPI and the
+# sources contain no autosummary directives, so skip scanning them for stubs.
+autosummary_generate = False
+
+# Inventories are looked up in source/inv first ("make inventories"), and
+# only downloaded when no local copy exists. Downloaded inventories are kept
+# in the doctree cache for ``intersphinx_cache_limit`` days.
+intersphinx_mapping = {
+    'python': ('https://docs.python.org/3', ('inv/python.inv', None)),
+    'numpy': ('https://numpy.org/doc/stable/', ('inv/numpy.inv', None)),
+    'nnabla': ('https://nnabla.readthedocs.io/en/latest/', ('inv/nnabla.inv', None)),
+}
+intersphinx_cache_limit = 30
+
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ['ntemplates']
 
-source_suffix = '.rst'
+source_suffix = {'.rst': 'restructuredtext'}
 # The master toctree document.
 master_doc = 'index'
 
 # List of patterns, relative to source directory, that match files and
 # directories to ignore when looking for source files.
 # This pattern also affects html_static_path and html_extra_path.
-exclude_patterns = []
+exclude_patterns = [
+    'inv',
+    '**/.ipynb_checkpoints',
+    'Thumbs.db',
+    '.DS_Store',
+]
 
 
 # -- Options for HTML output -------------------------------------------------
@@ -64,15 +107,39 @@ exclude_patterns = []
 # a list of builtin themes.
 #
 html_theme = "sphinx_rtd_theme"
-html_theme_path = [sphinx_rtd_theme.get_html_theme_path()]
 
 # Add any paths that contain custom static files (such as style sheets) here,
 # relative to this directory. They are copied after the builtin static files,
 # so a file named "default.css" will overwrite the builtin "default.css".
-html_static_path = []
-
-html_logo = "logo/logo.png"
-
-autodoc_mock_imports = [
-    "nnabla_ext.cuda",
-]
+html_static_path = ['_static']
+
+html_logo = '_static/logo.png'
+
+
+def _skip_imported_member(app, what, name, obj, skip, options):
+    # AutoAPI lists names imported into a module as members of that module.
+    # Keep autodoc's behaviour and only document them when they are
+    # re-exported through ``__all__``.
+    if getattr(obj, 'imported', False):
+        parent = app.env.autoapi_objects.get(obj.id.rpartition('.')[0])
+        return name not in (getattr(parent, 'all', None) or ())
+    return None
+
+
+def _add_package_path(app):
+    # Only the doctest builder executes code from the package, so the source
+    # tree is made importable for it alone and every other builder stays
+    # free of nnabla imports.
+    if app.builder.name == 'doctest':
+        sys.path.insert(0, os.path.abspath(os.path.join(app.confdir, '../../')))
+
+
+def setup(app):
+    app.connect('builder-inited', _add_package_path)
+    app.connect('autodoc-skip-member', _skip_imported_member)
+    # conf.py is loaded as an extension too, so it needs to declare itself
+    # parallel-safe for ``sphinx-build -j`` to use more than one process.
+    return {
+        'parallel_read_safe': True,
+        'parallel_write_safe': True,
+    }
@@ -15,37 +15,47 @@
 from collections import OrderedDict
 
 from .... import module as Mo
+from ...common.ofa.layers import conv_bn
 
 CANDIDATES = OrderedDict([
     ('MB1 3x3',
-        lambda inc, outc, s, n: InvertedResidual(
-            inc, outc, s, expand_ratio=1, kernel=(3, 3), name=n)),
+        lambda inc, outc, s, n, cl=False: InvertedResidual(
+            inc, outc, s, expand_ratio=1, kernel=(3, 3),
+            channel_last=cl, name=n)),
     ('MB3 3x3',
-        lambda inc, outc, s, n: InvertedResidual(
-            inc, outc, s, expand_ratio=3, kernel=(3, 3), name=n)),
+        lambda inc, outc, s, n, cl=False: InvertedResidual(
+            inc, outc, s, expand_ratio=3, kernel=(3, 3),
+            channel_last=cl, name=n)),
     ('MB6 3x3',
-        lambda inc, outc, s, n: InvertedResidual(
-            inc, outc, s, expand_ratio=6, kernel=(3, 3), name=n)),
+        lambda inc, outc, s, n, cl=False: InvertedResidual(
+            inc, outc, s, expand_ratio=6, kernel=(3, 3),
+            channel_last=cl, name=n)),
     ('MB1 5x5',
-        lambda inc, outc, s, n: InvertedResidual(
-            inc, outc, s, expand_ratio=1, kernel=(5, 5), name=n)),
+        lambda inc, outc, s, n, cl=False: InvertedResidual(
+            inc, outc, s, expand_ratio=1, kernel=(5, 5),
+            channel_last=cl, name=n)),
     ('MB3 5x5',
-        lambda inc, outc, s, n: InvertedResidual(
-            inc, outc, s, expand_ratio=3, kernel=(5, 5), name=n)),
+        lambda inc, outc, s, n, cl=False: InvertedResidual(
+            inc, outc, s, expand_ratio=3, kernel=(5, 5),
+            channel_last=cl, name=n)),
     ('MB6 5x5',
-        lambda inc, outc, s, n: InvertedResidual(
-            inc, outc, s, expand_ratio=6, kernel=(5, 5), name=n)),
+        lambda inc, outc, s, n, cl=False: InvertedResidual(
+            inc, outc, s, expand_ratio=6, kernel=(5, 5),
+            channel_last=cl, name=n)),
     ('MB1 7x7',
-        lambda inc, outc, s, n: InvertedResidual(
-            inc, outc, s, expand_ratio=1, kernel=(7, 7), name=n)),
+        lambda inc, outc, s, n, cl=False: InvertedResidual(
+            inc, outc, s, expand_ratio=1, kernel=(7, 7),
+            channel_last=cl, name=n)),
     ('MB3 7x7',
-        lambda inc, outc, s, n: InvertedResidual(
-            inc, outc, s, expand_ratio=3, kernel=(7, 7), name=n)),
+        lambda inc, outc, s, n, cl=False: InvertedResidual(
+            inc, outc, s, expand_ratio=3, kernel=(7, 7),
+            channel_last=cl, name=n)),
     ('MB6 7x7',
-        lambda inc, outc, s, n: InvertedResidual(
-            inc, outc, s, expand_ratio=6, kernel=(7, 7), name=n)),
+        lambda inc, outc, s, n, cl=False: InvertedResidual(
+            inc, outc, s, expand_ratio=6, kernel=(7, 7),
+            channel_last=cl, name=n)),
     ('skip_connect',
-        lambda inc, outc, s, n: Mo.Identity(name=n))
+        lambda inc, outc, s, n, cl=False: Mo.Identity(name=n))
 ])
 
 
@@ -63,10 +73,12 @@ class ConvBNReLU(Mo.Sequential):
             (width) two-dimensional kernel, specify (3,5).
         stride (:obj:`tuple` of :obj:`int`, optional): Stride sizes for
             dimensions. Defaults to None.
+        channel_last (bool, optional): If True, the inputs are in NHWC order.
+            Defaults to False.
     """
 
     def __init__(self, in_channels, out_channels, kernel=(3, 3),
-                 stride=(1, 1), group=1, name=''):
+                 stride=(1, 1), group=1, channel_last=False, name=''):
         self._in_channels = in_channels
         self._out_channels = out_channels
         self._kernel = kernel
@@ -77,12 +89,22 @@ class ConvBNReLU(Mo.Sequential):
         super(ConvBNReLU, self).__init__(
             Mo.Conv(in_channels, out_channels, self._kernel,
                     stride=self._stride, pad=self._pad, group=group,
-                    with_bias=False, name='{}/conv'.format(self.name)),
+                    with_bias=False, channel_last=channel_last,
+                    name='{}/conv'.format(self.name)),
             Mo.BatchNormalization(n_features=out_channels, n_dims=4,
+                                  axes=[3 if channel_last else 1],
                                   name='{}/bn'.format(self.name)),
             Mo.ReLU6(name='{}/relu6'.format(self.name))
         )
 
+    def call(self, input):
+        layers = list(self.modules.values())
+        if len(layers) < 3:
+            # the BN has been fused away, e.g., by fuse_bn_into_conv
+            return super(ConvBNReLU, self).call(input)
+        conv, bn, relu6 = layers
+        return relu6(conv_bn(conv, bn, input))
+
     def extra_repr(self):
         return (f'in_channels={self._in_channels}, '
                 f'out_channels={self._out_channels}, '
@@ -106,10 +128,18 @@ class InvertedResidual(Mo.Module):
             example, to apply convolution on an image with a 3 (height) by 5
             (width) two-dimensional kernel, specify (3, 5).
         expand_ratio(:obj:`int`): The expand ratio.
+        channel_last (bool, optional): If True, the inputs are in NHWC order.
+            Defaults to False.
+
+    Note:
+        At inference every BN is folded into its conv (see `conv_bn`), so each
+        of the expand, depthwise and project stages writes one tensor. The
+        expanded activations are released as soon as they are consumed when
+        the graph is run with ``forward(clear_buffer=True)``.
     """
 
     def __init__(self, in_channels, out_channels, stride, kernel=(3, 3),
-                 expand_ratio=1, name=''):
+                 expand_ratio=1, channel_last=False, name=''):
 
         assert stride in [1, 2]
 
@@ -129,25 +159,40 @@ class InvertedResidual(Mo.Module):
         layers = []
         if expand_ratio != 1:
             layers.append(ConvBNReLU(in_channels, hidden_dim, (1, 1),
+                                     channel_last=channel_last,
                                      name='{}/ConvBNReLU_0'.format(self.name)))
 
         layers.extend([
             ConvBNReLU(hidden_dim, hidden_dim, kernel=kernel,
                        stride=(stride, stride), group=hidden_dim,
+                       channel_last=channel_last,
                        name='{}/ConvBNReLU_1'.format(self.name)),
             Mo.Conv(hidden_dim, out_channels, kernel=(1, 1), stride=(1, 1),
-                    with_bias=False, name='{}/conv'.format(self.name)),
+                    with_bias=False, channel_last=channel_last,
+                    name='{}/conv'.format(self.name)),
             Mo.BatchNormalization(n_features=out_channels, n_dims=4,
+                                  axes=[3 if channel_last else 1],
                                   name='{}/bn'.format(self.name))
         ])
 
         self._conv = Mo.Sequential(*layers)
 
     def call(self, x):
+        layers = list(self._conv.modules.values())
+        out = x
+        if isinstance(layers[-1], Mo.BatchNormalization):
+            # the projecting conv and its BN are the last two layers
+            for m in layers[:-2]:
+                out = m(out)
+            out = conv_bn(*layers[-2:], out)
+        else:
+            # the BN has been fused away, e.g., by fuse_bn_into_conv
+            out = self._conv(out)
+
         if self._use_res_connect:
             # return x + self._conv(x)
-            return self._add_res(x, self._conv(x))
-        return self._conv(x)
+            return self._add_res(x, out)
+        return out
 
     def extra_repr(self):
         return (f'in_channels={self._in_channels}, '
@@ -159,7 +204,7 @@ class InvertedResidual(Mo.Module):
 
 class ChoiceBlock(Mo.Module):
     def __init__(self, in_channels, out_channels, stride,
-                 ops, mode='sample', name=''):
+                 ops, mode='sample', channel_last=False, name=''):
         self._in_channels = in_channels
         self._out_channels = out_channels
         self._stride = stride
@@ -167,7 +212,7 @@ class ChoiceBlock(Mo.Module):
 
         self._mixed = Mo.MixedOp(
             operators=[CANDIDATES[k](in_channels, out_channels,
-                                     stride, name)
+                                     stride, name, channel_last)
                        for k in ops],
             mode=mode, name=name
         )
@@ -56,6 +56,10 @@ class SearchNet(Model):
             None.
         skip_connect (bool, optional): Whether the skip connect is used.
             Defaults to `True`.
+        channel_last (bool, optional): If True, the network takes NHWC inputs
+            and all its layers work in NHWC order, which is faster with
+            cuDNN. Note that nnabla's CPU convolution only supports NCHW.
+            Defaults to `False`.
 
     References:
         Sandler, M., Howard, A., Zhu, M., Zhmoginov, A. and Chen, L.C., 2018.
@@ -72,12 +76,14 @@ class SearchNet(Model):
                  drop_rate=0,
                  candidates=None,
                  mode='sample',
-                 skip_connect=True):
+                 skip_connect=True,
+                 channel_last=False):
 
         Mo.Module.__init__(self, name=name)
         self._num_classes = num_classes
         self._width_mult = width_mult
         self._skip_connect = skip_connect
+        self._channel_last = channel_last
         self._arch_idx = None  # keeps current max arch
         round_nearest = 8
 
@@ -91,11 +97,11 @@ class SearchNet(Model):
             round_nearest
         )
         features = [ConvBNReLU(3, in_channels, stride=(2, 2),
-                    name='/init_conv')]
+                    channel_last=channel_last, name='/init_conv')]
 
         first_cell_width = _make_divisible(16 * width_mult, 8)
         features += [CANDIDATES['MB1 3x3'](
-            in_channels, first_cell_width, 1, '/init_block')]
+            in_channels, first_cell_width, 1, '/init_block', channel_last)]
         in_channels = first_cell_width
 
         if settings is None:
@@ -132,19 +138,22 @@ class SearchNet(Model):
                     ChoiceBlock(in_channels, output_channel,
                                 stride=stride, mode=mode,
                                 ops=curr_candidates,
+                                channel_last=channel_last,
                                 name='/res_block_{}'.format(i))
                 )
                 in_channels = output_channel
 
         # building last several layers
         features.append(ConvBNReLU(in_channels, self.last_channel,
-                                   kernel=(1, 1), name='/final_conv'))
+                                   kernel=(1, 1), channel_last=channel_last,
+                                   name='/final_conv'))
         # make it nn.Sequential
         self._features = Mo.Sequential(*features)
 
         # building classifier
         self._classifier = Mo.Sequential(
-            Mo.GlobalAvgPool(name='/final_avgpool'),
+            Mo.GlobalAvgPool(channel_last=channel_last,
+                             name='/final_avgpool'),
             Mo.Dropout(drop_rate, name='/final_dropout'),
             Mo.Linear(self.last_channel, num_classes, name='/final_affine'),
         )
@@ -198,7 +207,8 @@ class SearchNet(Model):
                 f'width_mult={self._width_mult}, '
                 f'settings={self._settings}, '
                 f'candidates={self._candidates}, '
-                f'skip_connect={self._skip_connect}')
+                f'skip_connect={self._skip_connect}, '
+                f'channel_last={self._channel_last}')
 
     def summary(self):
         def print_arch(arch_idx, op_names):
@@ -275,6 +285,8 @@ class TrainNet(SearchNet):
             Defaults to `True`.
         genotype(str, optional): The path to architecture file. Defaults to
             None.
+        channel_last (bool, optional): If True, the network takes NHWC inputs.
+            Defaults to `False`.
 
     References:
         [1] Sandler, M., Howard, A., Zhu, M., Zhmoginov, A. and Chen, L.C.,
@@ -291,12 +303,14 @@ class TrainNet(SearchNet):
                  candidates=None,
                  mode='sample',
                  skip_connect=True,
-                 genotype=None):
+                 genotype=None,
+                 channel_last=False):
 
         super().__init__(num_classes=num_classes, width_mult=width_mult,
                          settings=settings, drop_rate=drop_rate,
                          candidates=candidates, mode=mode,
-                         skip_connect=skip_connect)
+                         skip_connect=skip_connect,
+                         channel_last=channel_last)
 
         if genotype is not None:
             self.load_parameters(genotype)
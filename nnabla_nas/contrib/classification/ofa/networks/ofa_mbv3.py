@@ -46,29 +46,31 @@ CANDIDATES = {
 }
 
 
+# (ks, expand_ratio) of every candidate, `skip_connect` blocks keep the
+# default 3x3 kernel and expand ratio 4 of the supernet
+_CANDIDATE_ARCH = {name: (v['ks'] or 3, v['expand_ratio'] or 4)
+                   for name, v in CANDIDATES.items()}
+
+
 def candidates2subnetlist(candidates):
-    ks_list = []
-    expand_list = []
-    for candidate in candidates:
-        ks = CANDIDATES[candidate]['ks']
-        e = CANDIDATES[candidate]['expand_ratio']
-        if ks not in ks_list:
-            ks_list.append(ks)
-        if e not in expand_list:
-            expand_list.append(e)
+    # `skip_connect` has no kernel nor expand ratio to search over
+    archs = [CANDIDATES[c] for c in candidates if c != 'skip_connect']
+    ks_list = list(dict.fromkeys(a['ks'] for a in archs))
+    expand_list = list(dict.fromkeys(a['expand_ratio'] for a in archs))
     return ks_list, expand_list
 
 
 def genotype2subnetlist(op_candidates, genotype):
-    op_candidates.append('skip_connect')
-    subnet_list = [op_candidates[i] for i in genotype]
-    ks_list = [CANDIDATES[subnet]['ks'] if subnet != 'skip_connect'
-               else 3 for subnet in subnet_list]
-    expand_ratio_list = [CANDIDATES[subnet]['expand_ratio'] if subnet != 'skip_connect'
-                         else 4 for subnet in subnet_list]
-    depth_list = []
+    # `skip_connect` is indexed right after the given op candidates
+    op_candidates = val2list(op_candidates, 1) + ['skip_connect']
+    ks_list, expand_ratio_list, depth_list = [], [], []
+    last = len(genotype) - 1
     d = 0
-    for i, subnet in enumerate(subnet_list):
+    for i, idx in enumerate(genotype):
+        subnet = op_candidates[idx]
+        ks, e = _CANDIDATE_ARCH[subnet]
+        ks_list.append(ks)
+        expand_ratio_list.append(e)
         if subnet == 'skip_connect':
             if d > 1:
                 depth_list.append(d)
@@ -76,7 +78,7 @@ def genotype2subnetlist(op_candidates, genotype):
         elif d == 4:
             depth_list.append(d)
             d = 1
-        elif i == len(subnet_list) - 1:
+        elif i == last:
             depth_list.append(d + 1)
         else:
             d += 1
@@ -64,28 +64,21 @@ class ProcessGenotype:
 
     @classmethod
     def get_search_space(cls, candidates):
-        ks_list = []
-        expand_list = []
-        depth_list = []
-        for candidate in candidates:
-            ks = cls.CANDIDATES[candidate]['ks']
-            e = cls.CANDIDATES[candidate]['expand_ratio']
-            depth = cls.CANDIDATES[candidate]['depth']
-            if ks not in ks_list:
-                ks_list.append(ks)
-            if e not in expand_list:
-                expand_list.append(e)
-            if depth not in depth_list:
-                depth_list.append(depth)
+        archs = [cls.CANDIDATES[candidate] for candidate in candidates]
+        ks_list = list(dict.fromkeys(a['ks'] for a in archs))
+        expand_list = list(dict.fromkeys(a['expand_ratio'] for a in archs))
+        depth_list = list(dict.fromkeys(a['depth'] for a in archs))
         return ks_list, expand_list, depth_list
 
     @classmethod
     def get_subnet_arch(cls, op_candidates, genotype):
         # We don't need `skip_connect` with the current design of Xception41
-        subnet_list = [op_candidates[i] for i in genotype]
-        ks_list = [cls.CANDIDATES[subnet]['ks'] for subnet in subnet_list]
-        expand_ratio_list = [cls.CANDIDATES[subnet]['expand_ratio'] for subnet in subnet_list]
-        depth_list = [cls.CANDIDATES[subnet]['depth'] for subnet in subnet_list]
+        ks_list, expand_ratio_list, depth_list = [], [], []
+        for i in genotype:
+            arch = cls.CANDIDATES[op_candidates[i]]
+            ks_list.append(arch['ks'])
+            expand_ratio_list.append(arch['expand_ratio'])
+            depth_list.append(arch['depth'])
 
         assert ([d >= 1 for d in depth_list])
         return ks_list, expand_ratio_list, depth_list
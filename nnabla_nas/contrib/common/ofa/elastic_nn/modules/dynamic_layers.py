@@ -405,70 +405,42 @@ class DynamicMiddleFlowXPBlock(Mo.Module):
         max_middle_channel = make_divisible(
             round(max(self._in_channel_list) * max(self._expand_ratio_list)))
 
-        self._depth_conv1 = Mo.Sequential(OrderedDict([
-            ('act', build_activation('relu')),
-            ('dwconv', DynamicDepthwiseConv(max(self._in_channel_list), self._kernel_size_list, self._stride)),
-        ]))
-
-        self._point_linear1 = Mo.Sequential(OrderedDict([
-            ('ptconv', DynamicConv(max(self._in_channel_list), max_middle_channel, kernel=(1, 1))),
-            ('bn', DynamicBatchNorm(max_middle_channel, 4))
-        ]))
-
-        self._depth_conv2 = Mo.Sequential(OrderedDict([
-            ('act', build_activation('relu')),
-            ('dwconv', DynamicDepthwiseConv(max_middle_channel, self._kernel_size_list, self._stride)),
-        ]))
-
-        self._point_linear2 = Mo.Sequential(OrderedDict([
-            ('ptconv', DynamicConv(max_middle_channel, max_middle_channel, kernel=(1, 1))),
-            ('bn', DynamicBatchNorm(max_middle_channel, 4))
-        ]))
-
-        self._depth_conv3 = Mo.Sequential(OrderedDict([
-            ('act', build_activation('relu')),
-            ('dwconv', DynamicDepthwiseConv(max_middle_channel, self._kernel_size_list, self._stride)),
-        ]))
-
-        self._point_linear3 = Mo.Sequential(OrderedDict([
-            ('ptconv', DynamicConv(max_middle_channel, max(self._out_channel_list), kernel=(1, 1))),
-            ('bn', DynamicBatchNorm(max(self._out_channel_list), 4))
-        ]))
+        # three ReLU-DepthwiseConv-PointwiseConv-BN layers, the attribute
+        # names are kept as they are the keys of the saved parameters. Each
+        # layer owns its BN even when shapes match: the statistics differ
+        # per depth and are re-calibrated per subnet by set_running_statistics
+        for i in range(1, 4):
+            in_c = max(self._in_channel_list) if i == 1 else max_middle_channel
+            out_c = max(self._out_channel_list) if i == 3 else max_middle_channel
+            setattr(self, f'_depth_conv{i}', Mo.Sequential(OrderedDict([
+                ('act', build_activation('relu')),
+                ('dwconv', DynamicDepthwiseConv(in_c, self._kernel_size_list, self._stride)),
+            ])))
+            setattr(self, f'_point_linear{i}', Mo.Sequential(OrderedDict([
+                ('ptconv', DynamicConv(in_c, out_c, kernel=(1, 1))),
+                ('bn', DynamicBatchNorm(out_c, 4))
+            ])))
 
         self.runtime_depth = depth
         self.active_kernel_size = max(self._kernel_size_list)
         self.active_expand_ratio = max(self._expand_ratio_list)
         self.active_out_channel = max(self._out_channel_list)
 
-    def call(self, inp):
-        in_channel = inp.shape[1]
-
-        self._depth_conv1.dwconv.active_kernel_size = self.active_kernel_size
-        self._point_linear1.ptconv.active_out_channel = \
-            make_divisible(round(in_channel * self.active_expand_ratio))
-
-        self._depth_conv2.dwconv.active_kernel_size = self.active_kernel_size
-        self._point_linear2.ptconv.active_out_channel = \
-            make_divisible(round(in_channel * self.active_expand_ratio))
-
-        self._depth_conv3.dwconv.active_kernel_size = self.active_kernel_size
-        self._point_linear3.ptconv.active_out_channel = self.active_out_channel
-
-        if self.runtime_depth == 1:
-            self._point_linear1.ptconv.active_out_channel = self.active_out_channel
-        elif self.runtime_depth == 2:
-            self._point_linear2.ptconv.active_out_channel = self.active_out_channel
-
-        x = self._depth_conv1(inp)
-        x = self._point_linear1(x)
+    @property
+    def _layers(self):
+        return [(getattr(self, f'_depth_conv{i}'), getattr(self, f'_point_linear{i}')) for i in range(1, 4)]
 
-        if self.runtime_depth > 1:  # runtime depth
-            x = self._depth_conv2(x)
-            x = self._point_linear2(x)
+    def call(self, inp):
+        middle_channel = self.active_middle_channel(inp.shape[1])
+        for i, (depth_conv, point_linear) in enumerate(self._layers, 1):
+            depth_conv.dwconv.active_kernel_size = self.active_kernel_size
+            point_linear.ptconv.active_out_channel = self.active_out_channel \
+                if i in (self.runtime_depth, 3) else middle_channel
 
-        if self.runtime_depth > 2:  # runtime depth
-            x = self._depth_conv3(x)
-            x = self._point_linear3(x)
+        x = inp
+        for depth_conv, point_linear in self._layers[:self.runtime_depth]:
+            x = depth_conv(x)
+            x = point_linear(x)
 
         # Skip is a simple shortcut ->
         skip = inp
@@ -497,26 +469,11 @@ class DynamicMiddleFlowXPBlock(Mo.Module):
                     larger_stage = smaller_stage
 
         sorted_idx = np.argsort(-importance)
-        self._point_linear3.ptconv.conv._W.d = np.stack(
-            [self._point_linear3.ptconv.conv._W.d[:, idx, :, :] for idx in sorted_idx], axis=1)
-        adjust_bn_according_to_idx(self._point_linear3.bn.bn, sorted_idx)
-
-        self._point_linear2.ptconv.conv._W.d = np.stack(
-            [self._point_linear2.ptconv.conv._W.d[:, idx, :, :] for idx in sorted_idx], axis=1)
-        adjust_bn_according_to_idx(self._point_linear2.bn.bn, sorted_idx)
-
-        self._point_linear1.ptconv.conv._W.d = np.stack(
-            [self._point_linear1.ptconv.conv._W.d[:, idx, :, :] for idx in sorted_idx], axis=1)
-        adjust_bn_according_to_idx(self._point_linear1.bn.bn, sorted_idx)
-
-        self._depth_conv3.dwconv.conv._W.d = np.stack(
-            [self._depth_conv3.dwconv.conv._W.d[idx, :, :, :] for idx in sorted_idx], axis=0)
-
-        self._depth_conv2.dwconv.conv._W.d = np.stack(
-            [self._depth_conv2.dwconv.conv._W.d[idx, :, :, :] for idx in sorted_idx], axis=0)
-
-        self._depth_conv1.dwconv.conv._W.d = np.stack(
-            [self._depth_conv1.dwconv.conv._W.d[idx, :, :, :] for idx in sorted_idx], axis=0)
+        for depth_conv, point_linear in reversed(self._layers):
+            point_linear.ptconv.conv._W.d = point_linear.ptconv.conv._W.d[:, sorted_idx, :, :]
+            adjust_bn_according_to_idx(point_linear.bn.bn, sorted_idx)
+        for depth_conv, point_linear in reversed(self._layers):
+            depth_conv.dwconv.conv._W.d = depth_conv.dwconv.conv._W.d[sorted_idx, :, :, :]
 
     @property
     def in_channels(self):
@@ -538,37 +495,15 @@ class DynamicMiddleFlowXPBlock(Mo.Module):
 
         middle_channel = self.active_middle_channel(in_channel)
 
-        active_filter = self._depth_conv1.dwconv.get_active_filter(in_channel, self.active_kernel_size)
-        sub_layer.rep.sepconv1.dwconv._W.d = active_filter.d
-        copy_bn(sub_layer.rep.sepconv1.bn, self._point_linear1.bn.bn)
-
-        if self.runtime_depth == 1:
-            sub_layer.rep.sepconv1.pointwise._W.d =\
-                self._point_linear1.ptconv.conv._W.d[:self.active_out_channel, :in_channel, :, :]
-
-        if self.runtime_depth > 1:
-            active_filter = self._depth_conv2.dwconv.get_active_filter(middle_channel, self.active_kernel_size)
-            sub_layer.rep.sepconv2.dwconv._W.d = active_filter.d
-
-            copy_bn(sub_layer.rep.sepconv2.bn, self._point_linear2.bn.bn)
-
-            sub_layer.rep.sepconv1.pointwise._W.d =\
-                self._point_linear1.ptconv.conv._W.d[:middle_channel, :in_channel, :, :]
-
-        if self.runtime_depth == 2:
-            sub_layer.rep.sepconv2.pointwise._W.d =\
-                self._point_linear2.ptconv.conv._W.d[:self.active_out_channel, :middle_channel, :, :]
-
-        if self.runtime_depth > 2:
-            active_filter = self._depth_conv3.dwconv.get_active_filter(middle_channel, self.active_kernel_size)
-            sub_layer.rep.sepconv3.dwconv._W.d = active_filter.d
-            copy_bn(sub_layer.rep.sepconv3.bn, self._point_linear3.bn.bn)
-
-            sub_layer.rep.sepconv2.pointwise._W.d =\
-                self._point_linear2.ptconv.conv._W.d[:middle_channel, :middle_channel, :, :]
+        for i, (depth_conv, point_linear) in enumerate(self._layers[:self.runtime_depth], 1):
+            in_c = in_channel if i == 1 else middle_channel
+            out_c = self.active_out_channel if i == self.runtime_depth else middle_channel
+            sepconv = getattr(sub_layer.rep, f'sepconv{i}')
 
-            sub_layer.rep.sepconv3.pointwise._W.d =\
-                self._point_linear3.ptconv.conv._W.d[:self.active_out_channel, :middle_channel, :, :]
+            active_filter = depth_conv.dwconv.get_active_filter(in_c, self.active_kernel_size)
+            sepconv.dwconv._W.d = active_filter.d
+            copy_bn(sepconv.bn, point_linear.bn.bn)
+            sepconv.pointwise._W.d = point_linear.ptconv.conv._W.d[:out_c, :in_c, :, :]
 
         nn.set_auto_forward(False)
 
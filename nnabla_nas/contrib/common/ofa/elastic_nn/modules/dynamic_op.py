@@ -122,6 +122,7 @@ class DynamicConv(Mo.Module):
             self._max_in_channels, self._max_out_channels, self._kernel,
             stride=self._stride, dilation=(1, 1), with_bias=False
         )
+        self._padding = get_same_padding(self._kernel)
 
         self.active_out_channel = self._max_out_channels
 
@@ -133,8 +134,7 @@ class DynamicConv(Mo.Module):
             out_channel = self.active_out_channel
         in_channel = input.shape[1]
         filters = self.get_active_filter(out_channel, in_channel)
-        padding = get_same_padding(self._kernel)
-        return F.convolution(input, filters, None, pad=padding,
+        return F.convolution(input, filters, None, pad=self._padding,
                              stride=self._stride, dilation=self._dilation, group=1)
 
 
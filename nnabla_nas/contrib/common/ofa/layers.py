@@ -14,6 +14,7 @@
 import math
 from collections import OrderedDict
 
+import nnabla as nn
 import nnabla.functions as F
 
 from .... import module as Mo
@@ -40,20 +41,25 @@ def set_layer_from_config(layer_config):
     return layer.build_from_config(layer_config)
 
 
+def _bn_modules(net):
+    # walked lazily rather than cached on the net, BN modules are replaced
+    # by fuse_bn_into_conv and get_active_subnet builds new layers
+    return (m for _, m in net.get_modules() if isinstance(m, Mo.BatchNormalization))
+
+
 def set_bn_param(net, decay_rate, eps, **kwargs):
-    for _, m in net.get_modules():
-        if isinstance(m, Mo.BatchNormalization):
-            m._decay_rate = decay_rate
-            m._eps = eps
+    for m in _bn_modules(net):
+        m._decay_rate = decay_rate
+        m._eps = eps
 
 
 def get_bn_param(net):
-    for _, m in net.get_modules():
-        if isinstance(m, Mo.BatchNormalization):
-            return {
-                'decay_rate': m._decay_rate,
-                'eps': m._eps
-            }
+    m = next(_bn_modules(net), None)
+    if m is not None:
+        return {
+            'decay_rate': m._decay_rate,
+            'eps': m._eps
+        }
 
 
 def get_extra_repr(cur_obj):
@@ -86,7 +92,110 @@ def get_active_padding(kernel, stride, dilation):
     return (pad, pad)
 
 
+def fold_bn(conv, bn):
+    r"""Folds an inference-mode BatchNormalization into the preceding conv.
+
+    The folded weights are built as graph operations on the parameters,
+    thus they follow any later update of the conv or the BN statistics.
+
+    Args:
+        conv (:obj:`Conv`): The convolution feeding the BN.
+        bn (:obj:`BatchNormalization`): The batch normalization to fold.
+
+    Returns:
+        tuple of :obj:`nnabla.Variable`: The folded weight and bias.
+    """
+    n = conv._out_channels
+    scale = bn._gamma / F.pow_scalar(bn._var + bn._eps, 0.5)
+    w = conv._W * F.reshape(scale, (n,) + (1,) * (conv._W.ndim - 1))
+    shift = -bn._mean if conv._b is None else F.reshape(conv._b, bn._mean.shape) - bn._mean
+    b = F.reshape(shift * scale + bn._beta, (n,))
+    return w, b
+
+
+def _record_input_shapes(module, *shapes):
+    r"""Records the input shapes of a module which is skipped by a fused path,
+    as its `__call__` would. The latency profilers rebuild each module from
+    them."""
+    module.input_shapes = list(shapes)
+
+
+def conv_bn(conv, bn, x):
+    r"""Applies a Conv followed by a BatchNormalization.
+
+    At inference the BN is folded into the conv weights, so the conv output
+    is written once instead of being read back and rewritten by the BN.
+
+    Args:
+        conv (:obj:`Conv`): The convolution.
+        bn (:obj:`BatchNormalization`): The batch normalization.
+        x (:obj:`nnabla.Variable`): The input.
+
+    Returns:
+        :obj:`nnabla.Variable`: The normalized output.
+    """
+    if bn.training or bn.set_running_statistics:
+        return bn(conv(x))
+    _record_input_shapes(conv, x.shape)
+    w, b = fold_bn(conv, bn)
+    x = F.convolution(x, w, b, conv._base_axis, conv._pad, conv._stride,
+                      conv._dilation, conv._group, conv._channel_last)
+    _record_input_shapes(bn, x.shape)
+    return x
+
+
+def fuse_bn_into_conv(net):
+    r"""Absorbs every BatchNormalization that directly follows a Conv into
+    the conv weights and removes it from the network.
+
+    This rewrites the network in place and is meant for deployment only,
+    the fused network can no longer be trained nor re-calibrated.
+
+    Args:
+        net (:obj:`Module`): The network to fuse.
+
+    Returns:
+        :obj:`Module`: The fused network.
+    """
+    def fuse(conv, bn):
+        w, b = fold_bn(conv, bn)
+        nn.forward_all([w, b])
+        return Mo.Conv(conv._in_channels, conv._out_channels, conv._kernel,
+                       pad=conv._pad, stride=conv._stride, dilation=conv._dilation,
+                       group=conv._group, w_init=w.d.copy(), b_init=b.d.copy(),
+                       base_axis=conv._base_axis, channel_last=conv._channel_last)
+
+    for _, m in list(net.get_modules()):
+        if isinstance(m, Mo.Sequential):
+            keys = list(m.modules.keys())
+            for k, next_k in zip(keys[:-1], keys[1:]):
+                conv, bn = m.modules.get(k), m.modules.get(next_k)
+                if isinstance(conv, Mo.Conv) and isinstance(bn, Mo.BatchNormalization):
+                    m.modules[k] = fuse(conv, bn)
+                    del m.modules[next_k]
+        elif isinstance(m, DWSeparableConv) and m.bn is not None:
+            m.pointwise = fuse(m.pointwise, m.bn)
+            m.bn = None
+        elif isinstance(m, XceptionBlock) and isinstance(getattr(m, '_skipbn', None),
+                                                         Mo.BatchNormalization):
+            m._skip = fuse(m._skip, m._skipbn)
+            m._skipbn = Mo.Identity()
+    return net
+
+
 def build_activation(act_func, inplace=False):
+    r"""Builds the activation module of the given type.
+
+    Args:
+        act_func (str): Type of activation, one of 'relu', 'relu6',
+            'h_swish' or 'none'.
+        inplace (bool, optional): If True, the ReLU is inplace.
+            Defaults to False.
+
+    Returns:
+        :obj:`Module`: The activation, or None for `None` and 'none' so that
+        no module is created nor called for a linear layer.
+    """
     if act_func == 'relu':
         return Mo.ReLU(inplace=inplace)
     elif act_func == 'relu6':
@@ -119,7 +228,8 @@ class ResidualBlock(Mo.Module):
         elif self.shortcut is None:
             res = self.conv(x)
         else:
-            res = self.conv(x) + self.shortcut(x)
+            # the conv output is only consumed here, so it can be overwritten
+            res = F.add2(self.conv(x), self.shortcut(x), inplace=True)
         return res
 
     @staticmethod
@@ -187,6 +297,14 @@ class ConvLayer(Mo.Sequential):
 
         super(ConvLayer, self).__init__(module_dict)
 
+    def call(self, x):
+        if self._act_func == 'relu' and 'bn' in self.modules:
+            # BN+ReLU in a single fused kernel
+            x = self.bn(self.conv(x), nonlinearity='relu')
+            _record_input_shapes(self.act, x.shape)
+            return x
+        return super(ConvLayer, self).call(x)
+
     @staticmethod
     def build_from_config(config):
         return ConvLayer(**config)
@@ -378,7 +496,7 @@ class DWSeparableConv(Mo.Module):
             depthwise convolution layer. Defaults to (1, 1)
         use_bn (bool, optional): If True, BatchNormalization layer is added.
             Defaults to True.
-        act_func (str, optional) Type of activation. Defaults to None.
+        act_fn (str, optional) Type of activation. Defaults to None.
     """
 
     def __init__(
@@ -397,10 +515,11 @@ class DWSeparableConv(Mo.Module):
 
     def call(self, x):
         x = self.dwconv(x)
-        x = self.pointwise(x)
 
         if self.bn is not None:
-            x = self.bn(x)
+            x = conv_bn(self.pointwise, self.bn, x)
+        else:
+            x = self.pointwise(x)
 
         if self.act is not None:
             x = self.act(x)
@@ -444,12 +563,18 @@ class XceptionBlock(Mo.Module):
             of mid_channels. This is especially useful when this block
             is constructed by DynamicXPLayer for building the subnet.
             Defaults to None
+        downsample_mode (str, optional): How the block is downsampled when
+            stride is not (1, 1). 'maxpool' appends a 3x3 MaxPool, 'sepconv'
+            applies the stride in the depthwise conv of the last
+            DWSeparableConv instead, which saves a pass over the output.
+            Both give the same output shape and parameters.
+            Defaults to 'maxpool'.
     """
 
     def __init__(
             self, in_channels, out_channels, reps, kernel=(3, 3),
             stride=(1, 1), start_with_relu=True, grow_first=True,
-            expand_ratio=None):
+            expand_ratio=None, downsample_mode='maxpool'):
         super(XceptionBlock, self).__init__()
 
         self._in_channels = in_channels
@@ -476,25 +601,39 @@ class XceptionBlock(Mo.Module):
         # if reps==1, we just have a single DWSeparableConv and hence,
         # mid_channels is not required. grow_first and expand_ratio
         # are ignored completely.
+        if downsample_mode not in ('maxpool', 'sepconv'):
+            raise ValueError(f'do not support downsample_mode: {downsample_mode}')
+        strided_sepconv = stride != (1, 1) and downsample_mode == 'sepconv'
+
         for idx in range(1, reps + 1):
             inp_c = in_channels if idx == 1 else mid_channels
             out_c = out_channels if idx == reps else mid_channels
-
-            rep.append((f'relu{idx}', Mo.ReLU(inplace=True)))
-            rep.append((f'sepconv{idx}', DWSeparableConv(inp_c, out_c,
-                        kernel=kernel, stride=(1, 1), pad=pad_sep)))
-
+            if idx == reps and strided_sepconv:
+                rep.append((f'sepconv{idx}', DWSeparableConv(
+                    inp_c, out_c, kernel=kernel, stride=stride,
+                    pad=get_active_padding(kernel[0], stride[0], 1))))
+            else:
+                rep.append((f'sepconv{idx}', DWSeparableConv(inp_c, out_c,
+                            kernel=kernel, stride=(1, 1), pad=pad_sep)))
+
+        # the ReLU before each DWSeparableConv is applied in `call`, `None`
+        # skips it and the first one is not inplace since `inp` is reused by
+        # the skip connection
+        self._relu_inplace = [False] + [True] * (reps - 1)
         if not start_with_relu:
-            rep = rep[1:]
-        else:
-            rep[0] = ('relu1', Mo.ReLU(inplace=False))
+            self._relu_inplace[0] = None
 
-        if stride != (1, 1):
+        if stride != (1, 1) and not strided_sepconv:
             rep.append(('maxpool', Mo.MaxPool((3, 3), stride=stride, pad=(1, 1))))
+            self._relu_inplace.append(None)
         self.rep = Mo.Sequential(OrderedDict(rep))
 
     def call(self, inp):
-        x = self.rep(inp)
+        x = inp
+        for inplace, m in zip(self._relu_inplace, self.rep.modules.values()):
+            if inplace is not None:
+                x = F.relu(x, inplace=inplace)
+            x = m(x)
 
         if self._skip is not None:
             skip = self._skip(inp)
@@ -502,8 +641,7 @@ class XceptionBlock(Mo.Module):
         else:
             skip = inp
 
-        x += skip
-        return x
+        return F.add2(x, skip, inplace=True)
 
     @property
     def in_channels(self):
@@ -609,6 +747,12 @@ class BottleneckResidualBlock(Mo.Module):
 
         x = self.conv1(x)
         x = self.conv2(x)
+        if self._act_func == 'relu' and 'bn' in self.conv3.modules:
+            # BN, residual addition and ReLU in a single fused kernel
+            _record_input_shapes(self.conv3, x.shape)
+            x = self.conv3.bn(self.conv3.conv(x), z=residual, nonlinearity='relu')
+            _record_input_shapes(self.final_act, x.shape)
+            return x
         x = self.conv3(x)
 
         x = x + residual
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import lru_cache
+
 import numpy as np
 from omegaconf import ListConfig, OmegaConf
 import math
@@ -33,7 +35,7 @@ def label_smooth(target, n_classes: int, label_smoothing=0.1):
 
 def cross_entropy_loss_with_soft_target(pred, soft_target):
     """cross entropy loss between pred and soft_target"""
-    return F.mean(F.sum(- soft_target * F.log_softmax(pred), axis=1))
+    return F.sum(soft_target * F.log_softmax(pred)) * (-pred.shape[1] / pred.size)
 
 
 def cross_entropy_loss_with_label_smoothing(pred, target, label_smoothing=0.1):
@@ -120,6 +122,7 @@ def make_divisible(v, divisor=8, min_val=None):
     return new_v
 
 
+@lru_cache(maxsize=None)
 def get_same_padding(kernel_size):
     """get padding size that makes input and output size the same"""
     if isinstance(kernel_size, tuple):
@@ -132,6 +135,7 @@ def get_same_padding(kernel_size):
     return kernel_size // 2
 
 
+@lru_cache(maxsize=None)
 def sub_filter_start_end(kernel_size, sub_kernel_size):
     """ returns start and end point of the sub_filter """
     center = kernel_size // 2
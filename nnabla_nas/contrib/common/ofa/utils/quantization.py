@@ -0,0 +1,190 @@
+# Copyright (c) 2022 Sony Corporation. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+
+import numpy as np
+
+import nnabla as nn
+import nnabla.functions as F
+from nnabla.utils.save import save
+
+from ..... import module as Mo
+from ..layers import SEModule, _record_input_shapes, fuse_bn_into_conv
+
+
+def _qdq(x, scale):
+    r"""Symmetric int8 quantize-dequantize of `x` with the given scale."""
+    zero_point = nn.Variable.from_numpy_array(np.zeros(scale.shape))
+    y = F.quantize_linear(x, scale, zero_point, narrow_range=True)
+    return F.dequantize_linear(y, scale, zero_point)
+
+
+class QuantizedOp(Mo.Module):
+    r"""Int8 quantized wrapper of a `Conv`, `DwConv` or `Linear` module.
+
+    Weights are quantized per output channel, inputs per tensor with the
+    range observed during calibration. The quantize-dequantize pairs map
+    one to one to ONNX QuantizeLinear/DequantizeLinear nodes, so that an
+    int8 capable backend runs the wrapped op in int8.
+
+    Args:
+        module (:obj:`Module`): The module to quantize.
+    """
+
+    def __init__(self, module):
+        super().__init__(name=module.name)
+        self.module = module
+        self.calibrating = True
+        self._amax = 0.0
+        self._x_ndim = None
+        self._w_scale = None
+        self._x_scale = None
+
+    def freeze(self):
+        r"""Fixes the quantization scales once calibration is done.
+
+        Raises:
+            ValueError: The op was never reached during calibration.
+        """
+        if self._x_ndim is None:
+            raise ValueError(f'{self.module.name or type(self.module).__name__} '
+                             'was not called during calibration.')
+        w = self.module._W.d
+        axis = 1 if isinstance(self.module, Mo.Linear) else 0
+        shape = [1] * w.ndim
+        shape[axis] = w.shape[axis]
+        w_max = np.abs(np.moveaxis(w, axis, 0)).reshape(shape[axis], -1).max(axis=1)
+        self._w_scale = nn.Variable.from_numpy_array(
+            np.maximum(w_max, 1e-8).reshape(shape) / 127)
+        self._x_scale = nn.Variable.from_numpy_array(
+            np.full((1,) * self._x_ndim, max(self._amax, 1e-8) / 127))
+        self.calibrating = False
+
+    def call(self, input):
+        m = self.module
+        if self.calibrating:
+            self._amax = max(self._amax, float(np.abs(input.d).max()))
+            self._x_ndim = input.ndim
+            # the calibration batches must not hit the FAST_MODE cache
+            _record_input_shapes(m, input.shape)
+            return getattr(m, '_call_create', m.call)(input)
+
+        x = _qdq(input, self._x_scale)
+        w = _qdq(m._W, self._w_scale)
+        if isinstance(m, Mo.Linear):
+            return F.affine(x, w, m._b, m._base_axis)
+        if isinstance(m, Mo.DwConv):
+            return F.depthwise_convolution(x, w, m._b, m._base_axis, m._pad,
+                                           m._stride, m._dilation, m._multiplier)
+        return F.convolution(x, w, m._b, m._base_axis, m._pad, m._stride,
+                             m._dilation, m._group, m._channel_last)
+
+    def _call_cached(self, input):
+        if self.calibrating:
+            return self._call_create(input)
+        return super()._call_cached(input)
+
+    def extra_repr(self):
+        return f'amax={self._amax}'
+
+
+def quantize_int8(net, calib_loader):
+    r"""Post-training int8 quantization of a static subnet for inference.
+
+    BatchNormalization layers are first folded into their convolution, then
+    every `Conv`, `DwConv` and `Linear` is wrapped in a :obj:`QuantizedOp`
+    whose input range is calibrated over `calib_loader`. The
+    squeeze-and-excitation modules stay in floating point, since their
+    hard-sigmoid gate is sensitive to quantization.
+
+    Args:
+        net (:obj:`Module`): The static network to quantize, e.g. a
+            `TrainNet` subnet. It is modified in place.
+        calib_loader (iterable): Yields the inputs of the network, either
+            a :obj:`numpy.ndarray` or a tuple of them.
+
+    Returns:
+        :obj:`Module`: The quantized network.
+
+    Raises:
+        ValueError: Some op was never reached during calibration, e.g.
+            because `calib_loader` is empty.
+    """
+    net.apply(training=False)
+    fuse_bn_into_conv(net)
+
+    quantized = []
+
+    def wrap(module):
+        if isinstance(module, SEModule):
+            return
+        for name, m in list(module.modules.items()):
+            if isinstance(m, (Mo.Conv, Mo.DwConv, Mo.Linear)):
+                module.modules[name] = QuantizedOp(m)
+                quantized.append(module.modules[name])
+            else:
+                wrap(m)
+    wrap(net)
+
+    with nn.no_grad(), nn.auto_forward(True):
+        for data in calib_loader:
+            data = data if isinstance(data, (tuple, list)) else (data,)
+            net(*[nn.Variable.from_numpy_array(x) for x in data])
+
+    for m in quantized:
+        m.freeze()
+    return net
+
+
+def export_onnx(net, path, input_shape, opset=13):
+    r"""Exports a network to ONNX, e.g. for building a TensorRT engine.
+
+    A network quantized by :func:`quantize_int8` is exported with explicit
+    QuantizeLinear/DequantizeLinear nodes around every conv, which is the
+    form TensorRT requires to fuse depthwise-separable blocks in int8::
+
+        trtexec --int8 --onnx=<path> --saveEngine=<engine>
+
+    Note:
+        This requires the `nnabla_converter` package.
+
+    Args:
+        net (:obj:`Module`): The network to export.
+        path (str): The output ONNX file.
+        input_shape (tuple of int): The input shape, including the batch size.
+        opset (int, optional): The ONNX opset. Defaults to 13.
+    """
+    from nnabla.utils.converter.nnabla import NnpImporter
+    from nnabla.utils.converter.onnx import OnnxExporter
+
+    net.apply(training=False)
+    x = nn.Variable(input_shape)
+    with nn.no_grad():
+        y = net(x)
+
+    contents = {'networks': [{'name': 'net',
+                              'batch_size': input_shape[0],
+                              'outputs': {'y': y},
+                              'names': {'x': x}}],
+                'executors': [{'name': 'runtime',
+                               'network': 'net',
+                               'data': ['x'],
+                               'output': ['y']}]}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, 'net.nnp')
+        save(filename, contents, variable_batch_size=False)
+        nnp = NnpImporter(filename, expand_network=True, executor_index=None).execute()
+    OnnxExporter(nnp, input_shape[0], None, opset=str(opset)).execute(path)
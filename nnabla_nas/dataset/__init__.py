@@ -14,12 +14,14 @@
 
 from . import cifar10
 from . import csv
+
+__all__ = ['cifar10', 'csv']
+
 try:
     from . import imagenet
+    __all__ += ['imagenet']
 except ImportError:
     from nnabla.logger import logger
     logger.warning('Could not import nnabla_nas.dataset.imagenet')
     logger.warning(
         '  If you want to use nnabla_nas.dataset.imagenet, please install nvidia-dali-cuda???.')
-
-__all__ = ['cifar10', 'imagenet', 'csv']
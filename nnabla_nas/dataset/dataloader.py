@@ -21,6 +21,13 @@ class BaseDataLoader(ABC):
 
     It provides an iterable over the given dataset.
     Your dataloader should overwrite `next`, `transform`, and `__len__`.
+
+    The runners call `next` synchronously between two minibatches, so it
+    should hand out a batch that is already prepared. The provided loaders
+    do so: the nnabla `DataIterator` fetches the next batch in a background
+    thread and the DALI pipeline runs asynchronously. Data augmentation is
+    part of the graph (see `utils/data/transforms.py`) and runs on the
+    device.
     """
 
     @abstractmethod
@@ -99,7 +99,8 @@ class BatchNormalization(Module):
         self._var = Parameter(shape_stat, need_grad=False,
                               initializer=var_init,
                               scope=self._scope_name)
-        self._axes = axes
+        # a private tuple, the mutable default `axes` is never shared
+        self._axes = tuple(axes)
         self._decay_rate = decay_rate
         self._eps = eps
         self._n_features = n_features
@@ -111,12 +112,31 @@ class BatchNormalization(Module):
         self.mean_est = AverageMeter(self._scope_name)
         self.var_est = AverageMeter(self._scope_name)
 
-    def call(self, input):
+    def call(self, input, z=None, nonlinearity=None):
+        r"""Normalizes the input.
+
+        Args:
+            input (:obj:`nnabla.Variable`): The input.
+            z (:obj:`nnabla.Variable`, optional): A residual added to the
+                normalized output. Defaults to None.
+            nonlinearity (str, optional): 'relu' applies a ReLU after the
+                addition, fused with the normalization into a single
+                `fused_batch_normalization`. Defaults to None.
+
+        Raises:
+            ValueError: `nonlinearity` is neither None nor 'relu', or the
+                running statistics are estimated for `axes` other than [1].
+        """
+        if nonlinearity not in (None, 'relu'):
+            raise ValueError(f'Unsupported nonlinearity {nonlinearity}.')
         if self.set_running_statistics:
             """
             Note: this code block is verified with only
             once-for-all algorithm so far.
             """
+            if self._axes != (1,):
+                raise ValueError('Running statistics are only estimated for '
+                                 f'axes=[1], got axes={list(self._axes)}.')
             batch_mean = F.mean(input, axis=(0, 2, 3), keepdims=True)
             batch_var = F.mean(input ** 2, axis=(0, 2, 3),
                                keepdims=True) - batch_mean ** 2
@@ -125,15 +145,26 @@ class BatchNormalization(Module):
             self.var_est.update(batch_var.d, input.shape[0])
 
             _feature_dim = batch_mean.shape[1]
-            return F.batch_normalization(
+            output = F.batch_normalization(
                 input, self._beta[:, :_feature_dim, :, :], self._gamma[:, :_feature_dim, :, :],
                 batch_mean, batch_var, decay_rate=self._decay_rate, eps=self._eps, batch_stat=False
             )
+        elif nonlinearity == 'relu':
+            return F.fused_batch_normalization(input, self._beta, self._gamma,
+                                               self._mean, self._var, z,
+                                               self._axes, self._decay_rate,
+                                               self._eps, self.training,
+                                               nonlinearity, self._output_stat)
         else:
-            return F.batch_normalization(input, self._beta, self._gamma,
-                                         self._mean, self._var, self._axes,
-                                         self._decay_rate, self._eps,
-                                         self.training, self._output_stat)
+            output = F.batch_normalization(input, self._beta, self._gamma,
+                                           self._mean, self._var, self._axes,
+                                           self._decay_rate, self._eps,
+                                           self.training, self._output_stat)
+        if z is not None:
+            output = output + z
+        if nonlinearity == 'relu':
+            output = F.relu(output)
+        return output
 
     def extra_repr(self):
         return (f'n_features={self._n_features}, '
@@ -79,7 +79,10 @@ class Conv(Module):
                 rng=rng
             )
 
-        w_shape = (out_channels, in_channels // group) + tuple(kernel)
+        if channel_last:
+            w_shape = (out_channels,) + tuple(kernel) + (in_channels // group,)
+        else:
+            w_shape = (out_channels, in_channels // group) + tuple(kernel)
         b_shape = (out_channels, )
 
         self._b = None
@@ -18,7 +18,8 @@ from .module import Module
 
 
 class Hsigmoid(Module):
-    r"""Hswish layer.
+    r"""Hsigmoid layer, the piecewise-linear approximation of the sigmoid
+    ``relu6(x + 3) / 6`` used in MobileNetV3.
     Args:
         name (string): the name of this module
     """
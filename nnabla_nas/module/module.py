@@ -127,14 +127,16 @@ class Module(object):
         return object.__getattr__(self, name)
 
     def __setattr__(self, name, value):
-        def remove_from(*dicts):
-            for d in dicts:
-                d.pop(name, None)
-        remove_from(self.__dict__, self.modules, self.parameters)
+        # called for every attribute write while building a network, so the
+        # dictionaries are looked up once
+        modules, parameters = self.modules, self.parameters
+        self.__dict__.pop(name, None)
+        modules.pop(name, None)
+        parameters.pop(name, None)
         if isinstance(value, Module):
-            self.modules[name] = value
+            modules[name] = value
         elif isinstance(value, Parameter):
-            self.parameters[name] = value
+            parameters[name] = value
         else:
             object.__setattr__(self, name, value)
 
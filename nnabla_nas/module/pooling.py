@@ -100,12 +100,19 @@ class GlobalAvgPool(Module):
     r"""Global average pooling layer.
     It pools an averaged value from the whole image.
     Args:
+        channel_last(bool): If True, the last dimension is considered as
+            channel dimension, a.k.a NHWC order. Defaults to ``False``.
         name (string): the name of this module
     """
 
-    def __init__(self, name=''):
+    def __init__(self, channel_last=False, name=''):
         Module.__init__(self, name=name)
         self._scope_name = f'<globalavgpool at {hex(id(self))}>'
+        self._channel_last = channel_last
 
     def call(self, input):
+        if self._channel_last:
+            # keeps the spatial axes like global_average_pooling does
+            axis = tuple(range(1, input.ndim - 1))
+            return F.mean(input, axis=axis, keepdims=True)
         return F.global_average_pooling(input)
@@ -850,7 +850,10 @@ class Graph(mo.ModuleList, Module):
 
     @property
     def output(self):
-        return self[-1]
+        # the last module, without going through the string index of self[-1]
+        if not self.modules:
+            raise IndexError('index -1 is out of range')
+        return next(reversed(self.modules.values()))
 
     def _recursive_call(self):
         return self.output()
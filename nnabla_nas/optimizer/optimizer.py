@@ -56,14 +56,22 @@ class Optimizer(object):
         self._grad_clip = grad_clip
         self._retain_state = retain_state
         self._lr_scheduler = lr_scheduler
+        self._params = None  # last registered parameters
         self._iter = 0  # current iter
         self.cur_epoch = 0  # current epoch
 
     def set_parameters(self, params, **kargs):
-        r"""Set parameters by dictionary of keys and parameter Variables."""
+        r"""Set parameters by dictionary of keys and parameter Variables.
+
+        When states are retained, registering the same parameters again does
+        not change the solver, so the call returns right away.
+        """
+        if self._retain_state and not kargs and self._is_registered(params):
+            return
         if self._retain_state:
             self._states.update(self._solver.get_states())
         self._solver.set_parameters(params, **kargs)
+        self._params = OrderedDict(params)
         if self._retain_state:
             self._solver.set_states(
                 OrderedDict({
@@ -71,6 +79,12 @@ class Optimizer(object):
                 })
             )
 
+    def _is_registered(self, params):
+        r"""Whether `params` are exactly the last registered parameters."""
+        return (self._params is not None and
+                len(params) == len(self._params) and
+                all(self._params.get(k) is v for k, v in params.items()))
+
     def update(self):
         r"""Update parameters.
 
@@ -107,6 +121,7 @@ class Optimizer(object):
     def clear_parameters(self):
         r"""Clear all parameters."""
         self._solver.clear_parameters()
+        self._params = None
         self._iter = 0
         if self._retain_state:
             self._states.clear()
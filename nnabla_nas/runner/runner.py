@@ -13,12 +13,16 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from more_itertools import consume
 from pathlib import Path
 from os import environ
+import copy
 import json
 
 import nnabla as nn
+import nnabla.functions as F
 
 from ..utils.helper import ProgressMeter, get_output_path
 from ..utils.data import transforms
@@ -83,10 +87,22 @@ class Runner(ABC):
             'inputs': create_variables(self.mbs_train, hparams['input_shapes']),
             'targets': create_variables(self.mbs_train, hparams['target_shapes'])
         }
-        self.placeholder['valid'] = {
-            'inputs': create_variables(self.mbs_valid, hparams['input_shapes']),
-            'targets': create_variables(self.mbs_valid, hparams['target_shapes'])
-        }
+        if self.mbs_valid == self.mbs_train:
+            # each loop loads its minibatch right before using it and the
+            # two never interleave, so the input buffers can be shared
+            self.placeholder['valid'] = {
+                'inputs': self.placeholder['train']['inputs'],
+                'targets': self.placeholder['train']['targets']
+            }
+        else:
+            self.placeholder['valid'] = {
+                'inputs': create_variables(self.mbs_valid, hparams['input_shapes']),
+                'targets': create_variables(self.mbs_valid, hparams['target_shapes'])
+            }
+        # the arrays owned by the placeholders, see `_load_data`
+        for placeholder in self.placeholder.values():
+            placeholder['buffers'] = {key: [v.data for v in placeholder[key]]
+                                      for key in ('inputs', 'targets')}
 
         # monitor log info
         self._abs_output_path = str(Path(get_output_path(is_abspath=True)) / self.args['output_path'])
@@ -101,6 +117,10 @@ class Runner(ABC):
                           'enabled' if fast_mode else 'disabled'))
         self._fast_mode = fast_mode
 
+        # checkpoints are written to disk in the background
+        self._checkpoint_writer = ThreadPoolExecutor(max_workers=1)
+        self._pending_checkpoint = None
+
     @property
     def fast_mode(self):
         return self._fast_mode
@@ -180,14 +200,68 @@ class Runner(ABC):
     @staticmethod
     def _load_data(placeholder, data):
         for key in ('inputs', 'targets'):
-            for inp, x in zip(placeholder[key], data[key]):
+            buffers = placeholder['buffers'][key]
+            for inp, buf, x in zip(placeholder[key], buffers, data[key]):
                 if isinstance(x, nn.NdArray):
                     inp.data = x
                 else:
+                    # the placeholder may still be bound to an uploaded
+                    # minibatch, which must not be overwritten
+                    inp.data = buf
                     inp.d = x
 
+    @staticmethod
+    def _upload_data(data):
+        r"""Wraps the arrays of a minibatch into `NdArray`s.
+
+        Used for minibatches which are loaded several times, so that their
+        arrays are copied to the device only once. `_load_data` then binds
+        them to the placeholders without any further copy.
+        """
+        return {key: [x if isinstance(x, nn.NdArray)
+                      else nn.NdArray.from_numpy_array(x) for x in data[key]]
+                for key in ('inputs', 'targets')}
+
+    @staticmethod
+    def _accumulate(sums, key, var):
+        r"""Adds the data of `var` to `sums[key]`.
+
+        The sum is kept as an `NdArray` on the device, so that the value is
+        copied to the host only once it is read instead of after every
+        minibatch.
+        """
+        sums[key] = sums[key] + var.data if key in sums else F.identity(var.data)
+
+    def _update_monitor(self, sums, prefix, accum, n):
+        r"""Reports the sums collected by `_accumulate` over `accum`
+        minibatches of `n` samples in total.
+
+        The loss is already divided by `accum` in the graph, so its sum is
+        the mean, while the metrics still need to be averaged.
+        """
+        self.monitor.update(f'loss/{prefix}', sums['loss'].data, n)
+        for k, v in sums.items():
+            if k != 'loss':
+                self.monitor.update(f'{k}/{prefix}', v.data / accum, n)
+
+    @staticmethod
+    def _accumulate_into(total, var, scale):
+        r"""Adds the data of `var` times `scale` to the `NdArray` `total`.
+
+        Same as `_accumulate` for running totals stored on the runner, the
+        addition is written in place on the device.
+        """
+        F.add2(total, F.reshape(var.data, total.shape) * scale, outputs=[total])
+
     def save_checkpoint(self, checkpoint_info={}):
-        r"""Save the current states of the runner."""
+        r"""Save the current states of the runner.
+
+        The parameters are copied right away, the weights and the checkpoint
+        file are then written by a background thread while the next epoch
+        runs. A pending write is awaited, and logged, before the next one
+        starts.
+        """
+        self.wait_for_checkpoint()
         path = Path(self._abs_output_path) / 'checkpoint'
         path.mkdir(parents=True, exist_ok=True)
         relpath = Path(self._rel_output_path) / 'checkpoint'
@@ -202,14 +276,38 @@ class Runner(ABC):
         if ("best_metric" in checkpoint_info.keys() and "error" in checkpoint_info["best_metric"].keys()):
             checkpoint_info["best_metric"]["error"] = float(checkpoint_info["best_metric"]["error"])
 
-        # save parameters
-        self.model.save_parameters(str(path / 'weights.h5'))
+        # save parameters, from a snapshot taken before the next update
+        params = OrderedDict(
+            (k, nn.Variable.from_numpy_array(v.d, need_grad=v.need_grad))
+            for k, v in self.model.get_parameters().items()
+        )
         checkpoint_info['params_path'] = str(relpath / 'weights.h5')
 
-        with path.joinpath('checkpoint.json').open('w') as f:
-            json.dump(checkpoint_info, f)
-
-        self.monitor.info(f"Checkpoint saved: {str(path)}\n")
+        def write(info):
+            nn.save_parameters(str(path / 'weights.h5'), params)
+            # the json comes last, it only points to complete weights
+            with path.joinpath('checkpoint.json').open('w') as f:
+                json.dump(info, f)
+            return path
+
+        # a deep copy, the best metric is updated by the next validation
+        # while the json may still be pending
+        self._pending_checkpoint = self._checkpoint_writer.submit(write, copy.deepcopy(checkpoint_info))
+
+    def wait_for_checkpoint(self):
+        r"""Blocks until the last checkpoint is on disk, and raises any error
+        that occurred while writing it."""
+        if self._pending_checkpoint is not None:
+            pending, self._pending_checkpoint = self._pending_checkpoint, None
+            # logged here, the monitor is only written by the main thread
+            self.monitor.info(f"Checkpoint saved: {str(pending.result())}\n")
+
+    def close_checkpoint_writer(self):
+        r"""Waits for the last checkpoint, then stops the background writer."""
+        try:
+            self.wait_for_checkpoint()
+        finally:
+            self._checkpoint_writer.shutdown(wait=True)
 
     def load_checkpoint(self):
 
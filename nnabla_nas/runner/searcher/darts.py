@@ -45,15 +45,17 @@ class DartsSearcher(Searcher):
         if self.comm.n_procs > 1:
             self.event.default_stream_synchronize()
 
+        sums = dict()
         for _ in range(self.accum_train):
             self._load_data(p, self.dataloader['train'].next())
             p['loss'].forward(clear_no_need_grad=True)
             for k, m in p['metrics'].items():
                 m.forward(clear_buffer=True)
-                self.monitor.update(f'{k}/train', m.d.copy(), bz)
+                self._accumulate(sums, k, m)
             p['loss'].backward(clear_buffer=True)
-            loss = p['loss'].d.copy()
-            self.monitor.update('loss/train', loss * self.accum_train, bz)
+            self._accumulate(sums, 'loss', p['loss'])
+
+        self._update_monitor(sums, 'train', self.accum_train, bz * self.accum_train)
 
         if self.comm.n_procs > 1:
             self.comm.all_reduce(self._grads_net, division=True, inplace=False)
@@ -69,15 +71,17 @@ class DartsSearcher(Searcher):
         if self.comm.n_procs > 1:
             self.event.default_stream_synchronize()
 
+        sums = dict()
         for _ in range(self.accum_valid):
             self._load_data(p, self.dataloader['valid'].next())
             p['loss'].forward(clear_no_need_grad=True)
             for k, m in p['metrics'].items():
                 m.forward(clear_buffer=True)
-                self.monitor.update(f'{k}/valid', m.d.copy(), bz)
+                self._accumulate(sums, k, m)
             p['loss'].backward(clear_buffer=True)
-            loss = p['loss'].d.copy()
-            self.monitor.update('loss/valid', loss * self.accum_valid, bz)
+            self._accumulate(sums, 'loss', p['loss'])
+
+        self._update_monitor(sums, 'valid', self.accum_valid, bz * self.accum_valid)
 
         if self.comm.n_procs > 1:
             self.comm.all_reduce(self._grads_arch, division=True, inplace=False)
@@ -50,35 +50,39 @@ class FairNasSearcher(Searcher):
     def run(self):
         r"""Run the training process."""
         self.callback_on_start()
-        self._start_warmup()
-
-        # Training
-        for self.cur_epoch in range(self.cur_epoch, self.hparams['epoch']):
-            self.monitor.reset()
-            lr = self.optimizer['train'].get_learning_rate()
-            self.monitor.info(f'Running epoch={self.cur_epoch}\tlr={lr:.5f}\n')
-            # training loop
-            for i in range(self.one_epoch_train):
-                self.train_on_batch()
-                if i % (self.args['print_frequency']) == 0:
-                    train_keys = [m.name for m in self.monitor.meters.values()
-                                  if 'train' in m.name]
-                    self.monitor.display(i, key=train_keys)
-            # validation loop
-            for i in range(len(self.dataloader['valid']) // self.bs_valid):
-                # pick a random arch for each batch
-                self.update_graph('valid')
-                self.valid_on_batch()
-            self.callback_on_epoch_end()
-            self.monitor.write(self.cur_epoch)
-
-        # Search
-        for cur_sample in range(self.search_samples):
-            self.search_monitor.reset()
-            self.search_arch(sample_id=cur_sample)
-
-        self.logger.save(self._abs_output_path)
-        self.callback_on_finish()
+        try:
+            self._start_warmup()
+
+            # Training
+            for self.cur_epoch in range(self.cur_epoch, self.hparams['epoch']):
+                self.monitor.reset()
+                lr = self.optimizer['train'].get_learning_rate()
+                self.monitor.info(f'Running epoch={self.cur_epoch}\tlr={lr:.5f}\n')
+                # training loop
+                for i in range(self.one_epoch_train):
+                    self.train_on_batch()
+                    if i % (self.args['print_frequency']) == 0:
+                        train_keys = [m.name for m in self.monitor.meters.values()
+                                      if 'train' in m.name]
+                        self.monitor.display(i, key=train_keys)
+                # validation loop
+                for i in range(len(self.dataloader['valid']) // self.bs_valid):
+                    # pick a random arch for each batch
+                    self.update_graph('valid')
+                    self.valid_on_batch()
+                self.callback_on_epoch_end()
+                self.monitor.write(self.cur_epoch)
+
+            # Search
+            for cur_sample in range(self.search_samples):
+                self.search_monitor.reset()
+                self.search_arch(sample_id=cur_sample)
+
+            self.logger.save(self._abs_output_path)
+            self.callback_on_finish()
+        finally:
+            # also on errors, the last checkpoint may still be written
+            self.close_checkpoint_writer()
         self.monitor.close()
         self.search_monitor.close()
 
@@ -95,7 +99,8 @@ class FairNasSearcher(Searcher):
 
     def train_on_batch(self):
         r"""Update the model parameters."""
-        batch = [self.dataloader['train'].next()
+        # the minibatches are reused for every sample, upload them once
+        batch = [self._upload_data(self.dataloader['train'].next())
                  for _ in range(self.accum_train)]
         bz, p = self.mbs_train, self.placeholder['train']
         self.optimizer['train'].zero_grad()
@@ -105,17 +110,20 @@ class FairNasSearcher(Searcher):
 
         # At each batch, accum gradient for m sampled models
         # then update params.
+        n = bz * self.accum_train
         for _ in range(self.m_sampled):
             self.update_graph('train')
+            sums = dict()
             for data in batch:
                 self._load_data(p, data)
                 p['loss'].forward(clear_no_need_grad=True)
                 for k, m in p['metrics'].items():
                     m.forward(clear_buffer=True)
-                    self.monitor.update(f'{k}/train', m.d.copy(), bz)
+                    self._accumulate(sums, k, m)
                 p['loss'].backward(clear_buffer=True)
-                loss = p['loss'].d.copy()
-                self.monitor.update('loss/train', loss * self.accum_train, bz)
+                self._accumulate(sums, 'loss', p['loss'])
+
+            self._update_monitor(sums, 'train', self.accum_train, n)
 
         if self.comm.n_procs > 1:
             self.comm.all_reduce(self._grads_net, division=True, inplace=False)
@@ -134,9 +142,8 @@ class FairNasSearcher(Searcher):
             p['loss'].forward(clear_buffer=True)
             for k, m in p['metrics'].items():
                 m.forward(clear_buffer=True)
-                self.metrics[k].data += m.d.copy() * bz
-            loss = p['loss'].d.copy()
-            self.loss.data += loss * self.accum_valid * bz
+                self._accumulate_into(self.metrics[k], m, bz)
+            self._accumulate_into(self.loss, p['loss'], self.accum_valid * bz)
 
         if self.comm.n_procs > 1:
             self.event.add_default_stream_event()
@@ -68,29 +68,32 @@ class OFASearcher(Searcher):
     def run(self):
         r"""Run the training process."""
         self.callback_on_start()
+        try:
+            # Test for init parameters
+            if self.hparams['task'] != 'fullnet':
+                self.valid_genotypes(mode='test')
 
-        # Test for init parameters
-        if self.hparams['task'] != 'fullnet':
-            self.valid_genotypes(mode='test')
-
-        # training
-        for self.cur_epoch in range(self.cur_epoch, self.hparams['epoch']):
-            self.monitor.reset()
-            OFAResize.IS_TRAINING = True
-
-            lr = self.optimizer['train'].get_learning_rate()
-            self.monitor.info(f'Running epoch={self.cur_epoch}\tlr={lr:.5f}\n')
-
-            OFAResize.EPOCH = self.cur_epoch
-            for i in range(self.one_epoch_train):
-                self.train_on_batch(self.cur_epoch, i)
-                if i % (self.args['print_frequency']) == 0:
-                    train_keys = [m.name for m in self.monitor.meters.values()
-                                  if 'train' in m.name]
-                    self.monitor.display(i, key=train_keys)
-            if self.cur_epoch % self.hparams["validation_frequency"] == 0:
-                self.valid_genotypes(mode='valid')
-
+            # training
+            for self.cur_epoch in range(self.cur_epoch, self.hparams['epoch']):
+                self.monitor.reset()
+                OFAResize.IS_TRAINING = True
+
+                lr = self.optimizer['train'].get_learning_rate()
+                self.monitor.info(f'Running epoch={self.cur_epoch}\tlr={lr:.5f}\n')
+
+                OFAResize.EPOCH = self.cur_epoch
+                for i in range(self.one_epoch_train):
+                    self.train_on_batch(self.cur_epoch, i)
+                    if i % (self.args['print_frequency']) == 0:
+                        train_keys = [m.name for m in self.monitor.meters.values()
+                                      if 'train' in m.name]
+                        self.monitor.display(i, key=train_keys)
+                if self.cur_epoch % self.hparams["validation_frequency"] == 0:
+                    self.valid_genotypes(mode='valid')
+
+        finally:
+            # also on errors, the last checkpoint may still be written
+            self.close_checkpoint_writer()
         return self
 
     def callback_on_start(self):
@@ -126,20 +129,22 @@ class OFASearcher(Searcher):
             self.event.default_stream_synchronize()
 
         self.update_graph(key)
+        sums = dict()
         for _, data in enumerate(batch):
             self._load_data(p, data)
             p['loss'].forward(clear_no_need_grad=True)
             for k, m in p['metrics'].items():
                 m.forward(clear_buffer=True)
-                self.monitor.update(f'{k}/train', m.d.copy(), bz)
+                self._accumulate(sums, k, m)
             p['loss'].backward(clear_buffer=True)
-            loss = p['loss'].d.copy()
-            self.monitor.update('loss/train', loss * self.accum_train, bz)
+            self._accumulate(sums, 'loss', p['loss'])
+
+        self._update_monitor(sums, 'train', self.accum_train, bz * self.accum_train)
 
         if self.comm.n_procs > 1:
             self.comm.all_reduce(self._grads_net, division=True, inplace=False)
             self.comm.all_reduce(self._grads_no_decay_net, division=True, inplace=False)
-        self.event.add_default_stream_event()
+            self.event.add_default_stream_event()
 
         if key != 'train':
             self.optimizer[key].update()
@@ -162,14 +167,13 @@ class OFASearcher(Searcher):
             p['loss'].forward(clear_buffer=True)
             for k, m in p['metrics'].items():
                 m.forward(clear_buffer=True)
-                self.metrics[k].data += m.d.copy() * bz
-            loss = p['loss'].d.copy()
-            self.loss.data += loss * accum * bz
+                self._accumulate_into(self.metrics[k], m, bz)
+            self._accumulate_into(self.loss, p['loss'], accum * bz)
 
         if self.comm.n_procs > 1:
             self.comm.all_reduce(
                 [self.loss] + list(self.metrics.values()), division=True, inplace=False)
-        self.event.add_default_stream_event()
+            self.event.add_default_stream_event()
 
     def valid_genotypes(self, mode='valid'):
         assert mode in ['valid', 'test']
@@ -182,9 +186,11 @@ class OFASearcher(Searcher):
                 OFAResize.ACTIVE_SIZE = img_size
                 self.model.set_valid_arch(genotype)
                 self.reset_running_statistics()
+                # the subnet and the image size are fixed here, the graph is
+                # built once and replayed for every batch
+                self.update_graph(mode)
                 for _ in tqdm(range(self.one_epoch_valid if mode == 'valid' else self.one_epoch_test),
                               desc=f'{mode} [{self.cur_epoch}/{self.hparams["epoch"]}]'):
-                    self.update_graph(mode)
                     self.valid_on_batch(is_test=is_test)
                 self.monitor.info(f'img_size={img_size}, genotype={genotype} \n')
                 self.callback_on_epoch_end(is_test=is_test)
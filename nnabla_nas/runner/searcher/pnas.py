@@ -12,11 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import OrderedDict
+
 import nnabla as nn
 import numpy as np
 
 from .search import Searcher
 
+from nnabla_nas.module.mixedop import MixedOp
 from nnabla_nas.utils.estimator.latency import LatencyEstimator
 from nnabla_nas.utils.estimator.latency import LatencyGraphEstimator
 
@@ -28,13 +31,53 @@ class ProxylessNasSearcher(Searcher):
     def callback_on_start(self):
         r"""Gets the architecture parameters."""
         self._reward = nn.NdArray.from_numpy_array(np.zeros((1,)))
+        self._net_params = None
+        self._mixed_ops = None
+        self._latency = dict()
         # load checkpoint if available
         self.load_checkpoint()
 
+    def _get_net_parameters(self):
+        r"""Returns the network parameters of the sampled network.
+
+        Only the parameters of the sampled candidates need gradients, which
+        changes at every step, while the modules owning the parameters do
+        not. The latter are therefore collected once, and each call only
+        filters them instead of walking the whole module tree.
+        """
+        if self._net_params is None:
+            keys = self.model.get_net_parameters()
+            self._net_params = list()
+            for prefix, module in self.model.get_modules():
+                for name, p in module.parameters.items():
+                    key = prefix + ('/' if prefix else '') + name
+                    if key in keys:
+                        self._net_params.append((key, module, p))
+        return OrderedDict((k, p) for k, m, p in self._net_params
+                           if m.need_grad and p.need_grad)
+
+    def _get_latency(self, estimator):
+        r"""Returns the latency of the sampled network by a module-based
+        estimator.
+
+        The estimation only depends on which candidates are sampled, so it is
+        memoized by the active indices of the mixed operators. Collisions are
+        common once the architecture distribution concentrates.
+        """
+        if self._mixed_ops is None:
+            self._mixed_ops = [m for _, m in self.model.get_modules()
+                               if isinstance(m, MixedOp)]
+        if not self._mixed_ops:
+            return estimator.get_estimation(self.model)
+        key = (id(estimator),) + tuple(m.active_index for m in self._mixed_ops)
+        if key not in self._latency:
+            self._latency[key] = estimator.get_estimation(self.model)
+        return self._latency[key]
+
     def train_on_batch(self, key='train'):
         r"""Update the model parameters."""
         self.update_graph(key)
-        params = self.model.get_net_parameters(grad_only=True)
+        params = self._get_net_parameters()
         self.optimizer[key].set_parameters(params)
         bz, p = self.mbs_train, self.placeholder['train']
         self.optimizer[key].zero_grad()
@@ -43,15 +86,17 @@ class ProxylessNasSearcher(Searcher):
             grads = [x.grad for x in params.values()]
             self.event.default_stream_synchronize()
 
+        sums = dict()
         for _ in range(self.accum_train):
             self._load_data(p, self.dataloader['train'].next())
             p['loss'].forward(clear_no_need_grad=True)
             for k, m in p['metrics'].items():
                 m.forward(clear_buffer=True)
-                self.monitor.update(f'{k}/train', m.d.copy(), bz)
+                self._accumulate(sums, k, m)
             p['loss'].backward(clear_buffer=True)
-            loss = p['loss'].d.copy()
-            self.monitor.update('loss/train', loss * self.accum_train, bz)
+            self._accumulate(sums, 'loss', p['loss'])
+
+        self._update_monitor(sums, 'train', self.accum_train, bz * self.accum_train)
 
         if self.comm.n_procs > 1:
             self.comm.all_reduce(grads, division=True, inplace=False)
@@ -63,28 +108,35 @@ class ProxylessNasSearcher(Searcher):
         r"""Update the arch parameters."""
         beta, n_iter = 0.9, 10
         bz, p = self.mbs_valid, self.placeholder['valid']
-        valid_data = [self.dataloader['valid'].next()
+        # the minibatches are reused for every sample, upload them once
+        valid_data = [self._upload_data(self.dataloader['valid'].next())
                       for i in range(self.accum_valid)]
-        rewards, grads = [], []
+        rewards = np.empty((n_iter,), dtype=np.float32)
+
+        # the set of arch parameters does not depend on the sampled network
+        arch_params = self.model.get_arch_parameters(grad_only=True)
+        self.optimizer['valid'].set_parameters(arch_params)
+        # the advantage-weighted sum of the gradients of all samples
+        grads = dict()
 
         if self.comm.n_procs > 1:
             self.event.default_stream_synchronize()
 
-        for _ in range(n_iter):
-            reward = 0
+        for i in range(n_iter):
+            # samples a new network, the graph itself is cached in fast mode
             self.update_graph('valid')
-            arch_params = self.model.get_arch_parameters(grad_only=True)
-            self.optimizer['valid'].set_parameters(arch_params)
 
+            sums = dict()
             for minibatch in valid_data:
                 self._load_data(p, minibatch)
                 p['loss'].forward(clear_buffer=True)
                 for k, m in p['metrics'].items():
                     m.forward(clear_buffer=True)
-                    self.monitor.update(f'{k}/valid', m.d.copy(), bz)
-                loss = p['loss'].d.copy()
-                reward += (1 - p['metrics']['error'].d) / self.accum_valid
-                self.monitor.update('loss/valid', loss * self.accum_valid, bz)
+                    self._accumulate(sums, k, m)
+                self._accumulate(sums, 'loss', p['loss'])
+
+            self._update_monitor(sums, 'valid', self.accum_valid, bz * self.accum_valid)
+            reward = 1 - sums['error'].data / self.accum_valid
 
             # adding constraints
             for k, v in self.regularizer.items():
@@ -96,32 +148,35 @@ class ProxylessNasSearcher(Searcher):
                     value = v.get_estimation(out)
                 elif isinstance(v, LatencyEstimator):
                     #  when using LatencyEstimator (by module)
-                    value = v.get_estimation(self.model)
+                    value = self._get_latency(v)
                 else:
                     raise NotImplementedError
 
                 reward *= (min(1.0, v._bound / value))**v._weight
                 self.monitor.update(k, value, 1)
-            rewards.append(reward)
-            grads.append([m.g.copy() for m in arch_params.values()])
+            rewards[i] = np.ravel(reward)[0]
+
+            # accumulated on the device, only the scalar reward is on the host
+            advantage = float(rewards[i] - self._reward.data[0]) / n_iter
+            for k, m in arch_params.items():
+                g = m.grad * advantage
+                grads[k] = grads[k] + g if k in grads else g
 
-        # compute gradients
-        for j, m in enumerate(arch_params.values()):
-            m.grad.zero()
-            for i, r in enumerate(rewards):
-                m.g += (r - self._reward.data)*grads[i][j]/n_iter
+        for k, m in arch_params.items():
+            m.grad.copy_from(grads[k])
 
         # update global reward
-        self._reward.data = beta*sum(rewards)/n_iter + \
+        self._reward.data = beta*rewards.mean() + \
             (1 - beta)*self._reward.data
 
         if self.comm.n_procs > 1:
+            # inplace=False packs all arrays into one buffer, so the reward is
+            # reduced together with the gradients in a single call
             self.comm.all_reduce(
-                [x.grad for x in arch_params.values()],
+                [x.grad for x in arch_params.values()] + [self._reward],
                 division=True,
                 inplace=False
             )
-            self.comm.all_reduce(self._reward, division=True, inplace=False)
             self.event.add_default_stream_event()
 
         self.monitor.update('reward', self._reward.data[0], self.bs_valid)
@@ -23,25 +23,29 @@ class Searcher(Runner):
     def run(self):
         r"""Run the training process."""
         self.callback_on_start()
-        if self.cur_epoch == 0:
-            # do not run warmup if start from checkpoint
-            self._start_warmup()
-
-        for self.cur_epoch in range(self.cur_epoch, self.hparams['epoch']):
-            self.monitor.reset()
-            lr = self.optimizer['train'].get_learning_rate()
-            self.monitor.info(f'Running epoch={self.cur_epoch}\tlr={lr:.5f}\n')
-
-            for i in range(self.one_epoch_train):
-                self.train_on_batch()
-                self.valid_on_batch()
-                if i % (self.args['print_frequency']) == 0:
-                    self.monitor.display(i)
-
-            self.callback_on_epoch_end()
-            self.monitor.write(self.cur_epoch)
-
-        self.callback_on_finish()
+        try:
+            if self.cur_epoch == 0:
+                # do not run warmup if start from checkpoint
+                self._start_warmup()
+
+            for self.cur_epoch in range(self.cur_epoch, self.hparams['epoch']):
+                self.monitor.reset()
+                lr = self.optimizer['train'].get_learning_rate()
+                self.monitor.info(f'Running epoch={self.cur_epoch}\tlr={lr:.5f}\n')
+
+                for i in range(self.one_epoch_train):
+                    self.train_on_batch()
+                    self.valid_on_batch()
+                    if i % (self.args['print_frequency']) == 0:
+                        self.monitor.display(i)
+
+                self.callback_on_epoch_end()
+                self.monitor.write(self.cur_epoch)
+
+            self.callback_on_finish()
+        finally:
+            # also on errors, the last checkpoint may still be written
+            self.close_checkpoint_writer()
         self.monitor.close()
         return self
 
@@ -59,24 +59,27 @@ class Trainer(Runner):
     def run(self):
         """Run the training process."""
         self.callback_on_start()
-
-        for self.cur_epoch in range(self.cur_epoch, self.hparams['epoch']):
-            self.monitor.reset()
-            lr = self.optimizer['train'].get_learning_rate()
-            self.monitor.info(f'Running epoch={self.cur_epoch}\tlr={lr:.5f}\n')
-
-            for i in range(self.one_epoch_train):
-                self.train_on_batch()
-                if i % (self.args['print_frequency']) == 0:
-                    self.monitor.display(i, [k for k in self.monitor.meters if 'train' in k])
-
-            for i in trange(self.one_epoch_valid, disable=self.comm.rank > 0):
-                self.valid_on_batch()
-
-            self.callback_on_epoch_end()
-            self.monitor.write(self.cur_epoch)
-
-        self.callback_on_finish()
+        try:
+            for self.cur_epoch in range(self.cur_epoch, self.hparams['epoch']):
+                self.monitor.reset()
+                lr = self.optimizer['train'].get_learning_rate()
+                self.monitor.info(f'Running epoch={self.cur_epoch}\tlr={lr:.5f}\n')
+
+                for i in range(self.one_epoch_train):
+                    self.train_on_batch()
+                    if i % (self.args['print_frequency']) == 0:
+                        self.monitor.display(i, [k for k in self.monitor.meters if 'train' in k])
+
+                for i in trange(self.one_epoch_valid, disable=self.comm.rank > 0):
+                    self.valid_on_batch()
+
+                self.callback_on_epoch_end()
+                self.monitor.write(self.cur_epoch)
+
+            self.callback_on_finish()
+        finally:
+            # also on errors, the last checkpoint may still be written
+            self.close_checkpoint_writer()
         self.monitor.close()
 
     def train_on_batch(self, key='train'):
@@ -87,15 +90,17 @@ class Trainer(Runner):
         if self.comm.n_procs > 1:
             self.event.default_stream_synchronize()
 
+        sums = dict()
         for _ in range(self.accum_train):
             self._load_data(p, self.dataloader['train'].next())
             p['loss'].forward(clear_no_need_grad=True)
             for k, m in p['metrics'].items():
                 m.forward(clear_buffer=True)
-                self.monitor.update(f'{k}/train', m.d.copy(), bz)
+                self._accumulate(sums, k, m)
             p['loss'].backward(clear_buffer=True)
-            loss = p['loss'].d.copy()
-            self.monitor.update('loss/train', loss * self.accum_train, bz)
+            self._accumulate(sums, 'loss', p['loss'])
+
+        self._update_monitor(sums, 'train', self.accum_train, bz * self.accum_train)
 
         if self.comm.n_procs > 1:
             self.comm.all_reduce(self._grads, division=True, inplace=False)
@@ -115,9 +120,8 @@ class Trainer(Runner):
             p['loss'].forward(clear_buffer=True)
             for k, m in p['metrics'].items():
                 m.forward(clear_buffer=True)
-                self.metrics[k].data += m.d.copy() * bz
-            loss = p['loss'].d.copy()
-            self.loss.data += loss * self.accum_valid * bz
+                self._accumulate_into(self.metrics[k], m, bz)
+            self._accumulate_into(self.loss, p['loss'], self.accum_valid * bz)
 
         if self.comm.n_procs > 1:
             self.event.add_default_stream_event()
@@ -191,26 +191,33 @@ class RandomResizedCrop(object):
             specify "1.0".
         interpolation (str): Interpolation mode chosen from
             ('linear'|'nearest'). The default is 'linear'.
+        flip_lr (bool, optional): Whether to also flip the image horizontally
+            with a probability 0.5. This is done by the same
+            `image_augmentation` op, so it saves a separate pass compared
+            to `RandomHorizontalFlip`. Defaults to False.
     """
 
-    def __init__(self, shape, scale=None, ratio=None, interpolation='linear'):
+    def __init__(self, shape, scale=None, ratio=None, interpolation='linear',
+                 flip_lr=False):
         self._shape = shape
         self._scale = scale
         self._ratio = ratio
         self._interpolation = interpolation
+        self._flip_lr = flip_lr
 
     def __call__(self, input):
         return F.image_augmentation(
             input, shape=self._shape,
             min_scale=self._scale[0], max_scale=self._scale[1],
-            aspect_ratio=self._ratio)
+            aspect_ratio=self._ratio, flip_lr=self._flip_lr)
 
     def __str__(self):
         return self.__class__.__name__ + (
             f'(shape={self._shape}, '
             f'scale={self._scale}, '
             f'ratio={self._ratio}, '
-            f'interpolation={self.interpolation})'
+            f'interpolation={self._interpolation}, '
+            f'flip_lr={self._flip_lr})'
         )
 
 
@@ -296,8 +303,8 @@ def ImageNet_transform(key='train'):
     if key == 'train':
         return Compose([
             Normalize(mean=mean, std=std, scale=scale),
-            RandomResizedCrop((3, 224, 224), scale=(1.0, 2.3), ratio=1.33),
-            RandomHorizontalFlip()
+            RandomResizedCrop((3, 224, 224), scale=(1.0, 2.3), ratio=1.33,
+                              flip_lr=True)
         ])
 
     return Compose([
@@ -0,0 +1,32 @@
+# Copyright (c) 2022 Sony Corporation. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from nnabla_nas import module as Mo
+
+
+def _randomize_bn(module, rng):
+    for _, bn in module.get_modules():
+        if isinstance(bn, Mo.BatchNormalization):
+            for p in (bn._mean, bn._gamma, bn._beta):
+                p.d = rng.randn(*p.shape)
+            bn._var.d = rng.rand(*bn._var.shape) + 0.5
+
+
+@pytest.fixture
+def randomize_bn():
+    r"""Sets random statistics and affine parameters to every
+    BatchNormalization of a module, so that folding them is not a no-op."""
+    return _randomize_bn
@@ -13,8 +13,14 @@
 # limitations under the License.
 
 import nnabla as nn
+import numpy as np
 
+from nnabla_nas import module as Mo
 from nnabla_nas.contrib.classification.mobilenet import SearchNet
+from nnabla_nas.contrib.classification.mobilenet import TrainNet
+from nnabla_nas.contrib.classification.mobilenet.modules import InvertedResidual
+from nnabla_nas.contrib.common.ofa.utils.quantization import QuantizedOp
+from nnabla_nas.contrib.common.ofa.utils.quantization import quantize_int8
 
 
 def test_mobilenet():
@@ -23,3 +29,62 @@ def test_mobilenet():
 
     assert net(input).shape == (1, net._num_classes)
     assert str(net)
+
+
+def test_mobilenet_channel_last():
+    net = SearchNet(num_classes=1000, channel_last=True)
+    input = nn.Variable((1, 224, 224, 3))
+
+    # nnabla only runs NHWC convolutions with cuDNN, check the graph only
+    assert net(input).shape == (1, net._num_classes)
+    for _, m in net.get_modules():
+        if isinstance(m, Mo.BatchNormalization) and m.input_shapes:
+            assert m.input_shapes[0][3] == m._beta.shape[3]
+
+
+def test_inverted_residual_folded_bn(randomize_bn):
+    rng = np.random.RandomState(0)
+    m = InvertedResidual(8, 8, 1, expand_ratio=3)
+    randomize_bn(m, rng)
+    m.apply(training=False)
+    input = nn.Variable.from_numpy_array(rng.randn(2, 8, 8, 8))
+
+    output = m(input)
+    names = []
+    output.visit(lambda f: names.append(f.info.type_name))
+    assert 'BatchNormalization' not in names
+
+    # the same layers called one after the other, without folding
+    expected = input
+    for layer in m._conv.modules.values():
+        for mi in (layer.modules.values() if len(layer.modules) else [layer]):
+            expected = mi.call(expected)
+    expected = expected + input
+
+    nn.forward_all([output, expected])
+    assert np.allclose(output.d, expected.d, atol=1e-5)
+
+
+def test_quantize_int8(randomize_bn):
+    rng = np.random.RandomState(0)
+    m = InvertedResidual(8, 8, 1, expand_ratio=3)
+    randomize_bn(m, rng)
+    m.apply(training=False)
+
+    input = nn.Variable.from_numpy_array(rng.rand(2, 8, 8, 8))
+    expected = m(input)
+    expected.forward()
+
+    quantize_int8(m, [rng.rand(2, 8, 8, 8) for _ in range(2)])
+    assert not any(isinstance(bn, Mo.BatchNormalization) for _, bn in m.get_modules())
+
+    output = m(input)
+    output.forward()
+    assert np.allclose(output.d, expected.d, atol=5e-2 * np.abs(expected.d).max())
+
+    net = TrainNet(num_classes=10)
+    quantize_int8(net, [rng.rand(2, 3, 32, 32)])
+    modules = [m for _, m in net.get_modules()]
+    n_ops = sum(isinstance(m, (Mo.Conv, Mo.Linear)) for m in modules)
+    assert sum(isinstance(m, QuantizedOp) for m in modules) == n_ops
+    assert net(nn.Variable((2, 3, 32, 32))).shape == (2, 10)
@@ -13,8 +13,18 @@
 # limitations under the License.
 
 import nnabla as nn
+import numpy as np
+import pytest
 
+from nnabla_nas import module as Mo
 from nnabla_nas.contrib.classification.ofa.networks.ofa_mbv3 import SearchNet
+from nnabla_nas.contrib.classification.ofa.networks.ofa_mbv3 import candidates2subnetlist
+from nnabla_nas.contrib.classification.ofa.networks.ofa_mbv3 import genotype2subnetlist
+from nnabla_nas.contrib.common.ofa.layers import MBConvLayer
+from nnabla_nas.contrib.common.ofa.layers import fuse_bn_into_conv
+from nnabla_nas.contrib.common.ofa.utils.quantization import QuantizedOp
+from nnabla_nas.contrib.common.ofa.utils.quantization import export_onnx
+from nnabla_nas.contrib.common.ofa.utils.quantization import quantize_int8
 
 
 def test_ofa_mbv3():
@@ -23,3 +33,89 @@ def test_ofa_mbv3():
 
     assert net(input).shape == (1, net._num_classes)
     assert str(net)
+
+
+def test_fuse_bn_into_conv(randomize_bn):
+    rng = np.random.RandomState(0)
+    m = MBConvLayer(4, 8, use_se=True)
+    randomize_bn(m, rng)
+    m.apply(training=False)
+
+    input = nn.Variable.from_numpy_array(rng.randn(2, 4, 8, 8))
+    expected = m(input)
+    expected.forward()
+
+    fuse_bn_into_conv(m)
+    assert not any(isinstance(bn, Mo.BatchNormalization) for _, bn in m.get_modules())
+
+    output = m(input)
+    output.forward()
+    assert np.allclose(output.d, expected.d, atol=1e-5)
+
+
+def test_genotype2subnetlist():
+    op_candidates = ["MB3 3x3", "MB6 7x7"]
+    genotype = [0, 1, 2, 2] * 5
+
+    ks_list, expand_ratio_list, depth_list = genotype2subnetlist(op_candidates, genotype)
+    assert ks_list == [3, 7, 3, 3] * 5
+    assert expand_ratio_list == [3, 6, 4, 4] * 5
+    assert depth_list == [2, 2, 2, 2, 2]
+    assert op_candidates == ["MB3 3x3", "MB6 7x7"]
+
+
+def test_quantize_int8():
+    rng = np.random.RandomState(0)
+    m = MBConvLayer(4, 8, use_se=True)
+    m.apply(training=False)
+
+    input = nn.Variable.from_numpy_array(rng.rand(2, 4, 8, 8))
+    expected = m(input)
+    expected.forward()
+
+    quantize_int8(m, [rng.rand(2, 4, 8, 8) for _ in range(2)])
+    assert isinstance(m.point_linear.conv, QuantizedOp)
+    assert isinstance(m.depth_conv.se.fc.reduce, Mo.Conv)
+
+    output = m(input)
+    output.forward()
+    assert np.allclose(output.d, expected.d, atol=1e-2)
+    assert m.point_linear.conv.name == m.point_linear.conv.module.name
+
+    with pytest.raises(ValueError):
+        quantize_int8(MBConvLayer(4, 8), [])
+
+
+def test_export_onnx(tmp_path):
+    onnx = pytest.importorskip('onnx')
+    pytest.importorskip('nnabla.utils.converter.onnx')
+    rng = np.random.RandomState(0)
+    m = quantize_int8(MBConvLayer(4, 8), [rng.rand(2, 4, 8, 8)])
+
+    path = str(tmp_path / 'net.onnx')
+    export_onnx(m, path, (1, 4, 8, 8))
+
+    op_types = {node.op_type for node in onnx.load(path).graph.node}
+    assert {'QuantizeLinear', 'DequantizeLinear'} <= op_types
+
+
+def test_candidates2subnetlist():
+    ks_list, expand_list = candidates2subnetlist(["MB6 7x7", "MB3 7x7", "MB6 3x3", "skip_connect"])
+    assert ks_list == [7, 3]
+    assert expand_list == [6, 3]
+
+
+def test_elastic_depth_skips_blocks():
+    net = SearchNet(num_classes=10, op_candidates=["MB6 3x3", "MB3 3x3"], depth_candidates=[2, 3, 4])
+    net.apply(training=False)
+    input = nn.Variable((1, 3, 32, 32))
+
+    def num_convs(depth):
+        net.set_active_subnet(d=depth)
+        names = []
+        net(input).visit(lambda f: names.append(f.info.type_name))
+        return names.count('Convolution') + names.count('DepthwiseConvolution')
+
+    # each of the 5 stages drops 2 MBConv blocks, i.e., 3 convolutions plus 2 in SE modules
+    # for the 3 stages using SE
+    assert num_convs(4) - num_convs(2) == 5 * 2 * 3 + 3 * 2 * 2
@@ -13,8 +13,11 @@
 # limitations under the License.
 
 import nnabla as nn
+import numpy as np
 
 from nnabla_nas.contrib.classification.ofa.networks.ofa_xception import SearchNet
+from nnabla_nas.contrib.common.ofa.layers import DWSeparableConv
+from nnabla_nas.contrib.common.ofa.layers import XceptionBlock
 
 
 def test_ofa_xception():
@@ -23,3 +26,40 @@ def test_ofa_xception():
 
     assert net(input).shape == (1, net._num_classes)
     assert str(net)
+
+
+def test_dwseparableconv_folded_bn(randomize_bn):
+    rng = np.random.RandomState(0)
+    m = DWSeparableConv(4, 6, kernel=(3, 3), pad=(1, 1), act_fn='relu')
+    randomize_bn(m, rng)
+    m.apply(training=False)
+
+    input = nn.Variable.from_numpy_array(rng.randn(2, 4, 8, 8))
+    output = m(input)
+    assert m.pointwise.input_shapes == [(2, 4, 8, 8)]
+    assert m.bn.input_shapes == [(2, 6, 8, 8)]
+    expected = m.act(m.bn(m.pointwise(m.dwconv(input))))
+    nn.forward_all([output, expected])
+
+    assert np.allclose(output.d, expected.d, atol=1e-5)
+
+
+def test_xceptionblock_layers():
+    m = XceptionBlock(8, 16, reps=3, stride=(2, 2))
+    assert list(m.rep.modules) == ['sepconv1', 'sepconv2', 'sepconv3', 'maxpool']
+    for i in range(1, 4):
+        assert list(m.rep.modules[f'sepconv{i}'].modules) == ['dwconv', 'pointwise', 'bn']
+
+    input = nn.Variable((1, 8, 16, 16))
+    functions = []
+    m(input).visit(lambda f: functions.append(f.info.type_name))
+    assert functions.count('Convolution') == 3 * 2 + 1
+    assert functions.count('BatchNormalization') == 3 + 1
+
+
+def test_xceptionblock_strided_sepconv():
+    m = XceptionBlock(8, 16, reps=2, stride=(2, 2), downsample_mode='sepconv')
+    assert 'maxpool' not in m.rep.modules
+
+    input = nn.Variable((1, 8, 15, 15))
+    assert m(input).shape == (1, 16, 8, 8)
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import nnabla as nn
+import nnabla.functions as F
 import numpy as np
 import pytest
 
@@ -40,3 +41,30 @@ def test_batchnorm(fix_parameters):
     input.d = np.random.randn(*input.shape)
     output.forward()
     assert not np.isnan(output.d).any()
+
+
+@pytest.mark.parametrize('training', [True, False])
+def test_batchnorm_fused_relu(training, randomize_bn):
+    module = BatchNormalization(n_features=5, n_dims=4)
+    module.training = training
+    randomize_bn(module, np.random)
+    input = nn.Variable.from_numpy_array(np.random.randn(8, 5, 4, 4))
+    z = nn.Variable.from_numpy_array(np.random.randn(8, 5, 4, 4))
+
+    output = module(input, z, nonlinearity='relu')
+    expected = F.relu(module(input) + z)
+    nn.forward_all([output, expected])
+
+    assert np.allclose(output.d, expected.d, atol=1e-5)
+
+    with pytest.raises(ValueError):
+        module(input, nonlinearity='sigmoid')
+
+
+def test_batchnorm_running_statistics_channel_last():
+    module = BatchNormalization(n_features=5, n_dims=4, axes=[3])
+    module.set_running_statistics = True
+    input = nn.Variable.from_numpy_array(np.random.randn(8, 4, 4, 5))
+
+    with pytest.raises(ValueError):
+        module(input)
@@ -20,6 +20,7 @@ import pytest
 from nnabla_nas.utils.data.transforms import Normalize
 from nnabla_nas.utils.data.transforms import RandomCrop
 from nnabla_nas.utils.data.transforms import RandomHorizontalFlip
+from nnabla_nas.utils.data.transforms import RandomResizedCrop
 from nnabla_nas.utils.data.transforms import RandomVerticalFlip
 from nnabla_nas.utils.data.transforms import Resize
 
@@ -74,3 +75,13 @@ def test_random_crop():
     output = tran(input)
     assert print(tran) is None
     assert output.shape == (16, 3, 16, 16)
+
+
+@pytest.mark.parametrize('flip_lr', [False, True])
+def test_random_resized_crop(flip_lr):
+    input = nn.Variable((16, 3, 32, 32))
+    tran = RandomResizedCrop(shape=(3, 16, 16), scale=(1.0, 2.0), ratio=1.33,
+                             flip_lr=flip_lr)
+    output = tran(input)
+    assert print(tran) is None
+    assert output.shape == (16, 3, 16, 16)